@@ -0,0 +1,57 @@
+"""
+CLI subcommands and the helpers they share
+"""
+
+import functools
+import sys
+
+from ..config import Config
+
+
+@functools.cache
+def get_console():
+    """Get the shared rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def truncate(text: str, width: int = 80) -> str:
+    """Truncate text to at most width characters, ending with an ellipsis if cut."""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def load_config(loader=Config.load, validate: bool = False) -> Config:
+    """
+    Load configuration, exiting with a message if it cannot be read.
+    
+    Args:
+        loader: Function that builds the Config
+        validate: If True, also exit on any error from Config.validate(),
+            including the top-level settings the clients don't check
+            
+    Returns:
+        Loaded configuration
+    """
+    try:
+        config = loader()
+    except Exception as e:
+        get_console().print(f"[red]Failed to load configuration: {e}[/red]")
+        sys.exit(1)
+    
+    if validate:
+        errors = config.validate()
+        if errors:
+            exit_with_config_errors(errors)
+    
+    return config
+
+
+def exit_with_config_errors(errors):
+    """Print configuration errors and exit."""
+    console = get_console()
+    console.print("[red]Configuration errors:[/red]")
+    for error in errors:
+        console.print(f"  • {error}")
+    console.print("\n[yellow]Please check your .env file[/yellow]")
+    sys.exit(1)
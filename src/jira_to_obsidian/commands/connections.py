@@ -0,0 +1,92 @@
+"""
+Command for testing the JIRA and Obsidian connections
+"""
+
+import sys
+
+import click
+
+from ..config import ConfigError
+from . import exit_with_config_errors, get_console, load_config
+
+
+@click.command()
+def test_connections():
+    """Test connections to JIRA and Obsidian."""
+    from rich.panel import Panel
+
+    from ..sync import JiraObsidianSync
+
+    console = get_console()
+    console.print("\n[bold]Testing connections...[/bold]\n")
+    
+    config = load_config(validate=True)
+    
+    # Test connections
+    try:
+        sync = JiraObsidianSync(config)
+        results = sync.test_connections()
+        
+        # Display JIRA results
+        jira_results = results["jira"]
+        if jira_results["connected"]:
+            jira_panel = Panel(
+                f"[green]✓ Connected[/green]\n"
+                f"Server: {jira_results.get('server_title', 'Unknown')}\n"
+                f"Version: {jira_results.get('server_version', 'Unknown')}\n"
+                f"User: {jira_results.get('user', 'Unknown')}\n\n"
+                f"Accessible projects: {', '.join([p['key'] for p in jira_results.get('accessible_projects', [])])}\n"
+                f"Inaccessible projects: {', '.join(jira_results.get('inaccessible_projects', []))}",
+                title="[bold green]JIRA Connection[/bold green]",
+                border_style="green"
+            )
+        else:
+            jira_panel = Panel(
+                f"[red]✗ Connection Failed[/red]\n"
+                f"Error: {jira_results.get('error', 'Unknown error')}",
+                title="[bold red]JIRA Connection[/bold red]",
+                border_style="red"
+            )
+        console.print(jira_panel)
+        
+        # Display Obsidian results
+        obsidian_results = results["obsidian"]
+        if obsidian_results["connected"]:
+            if obsidian_results.get("authenticated", False):
+                obsidian_panel = Panel(
+                    f"[green]✓ Connected and Authenticated[/green]\n"
+                    f"API Version: {obsidian_results.get('api_version', 'Unknown')}\n"
+                    f"Folder exists: {'Yes' if obsidian_results.get('folder_exists', False) else 'No'}\n"
+                    f"Folder path: {obsidian_results.get('folder_path', 'Unknown')}",
+                    title="[bold green]Obsidian Connection[/bold green]",
+                    border_style="green"
+                )
+            else:
+                obsidian_panel = Panel(
+                    f"[yellow]⚠ Connected but not authenticated[/yellow]\n"
+                    f"Error: {obsidian_results.get('error', 'Unknown error')}",
+                    title="[bold yellow]Obsidian Connection[/bold yellow]",
+                    border_style="yellow"
+                )
+        else:
+            obsidian_panel = Panel(
+                f"[red]✗ Connection Failed[/red]\n"
+                f"Error: {obsidian_results.get('error', 'Unknown error')}",
+                title="[bold red]Obsidian Connection[/bold red]",
+                border_style="red"
+            )
+        console.print(obsidian_panel)
+        
+        # Overall status
+        if jira_results["connected"] and obsidian_results["connected"] and obsidian_results.get("authenticated", False):
+            console.print("\n[bold green]✅ All connections successful![/bold green]")
+            sys.exit(0)
+        else:
+            console.print("\n[bold red]❌ Some connections failed. Please check your configuration.[/bold red]")
+            sys.exit(1)
+            
+    except ConfigError as e:
+        exit_with_config_errors(e.errors)
+    except Exception as e:
+        console.print(f"\n[red]Unexpected error: {e}[/red]")
+        sys.exit(1)
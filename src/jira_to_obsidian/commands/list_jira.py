@@ -0,0 +1,89 @@
+"""
+Command for listing JIRA tickets
+"""
+
+import sys
+from dataclasses import replace
+
+import click
+
+from ..config import Config, ConfigError
+from . import exit_with_config_errors, get_console, load_config, truncate
+
+# Priority colors for list-jira
+_PRIORITY_COLORS = {
+    "Highest": "red",
+    "High": "bright_red",
+    "Medium": "yellow",
+    "Low": "green",
+    "Lowest": "bright_green"
+}
+
+
+@click.command()
+@click.option('--project', '-p', help='Filter by specific project key (e.g., PROJ)')
+def list_jira(project: str):
+    """List all JIRA tickets sorted by priority (excluding Done/Resolved/Closed)."""
+    from itertools import chain
+
+    from rich.live import Live
+    from rich.table import Table
+
+    from ..jira_client import JiraClient
+
+    console = get_console()
+    config = load_config(Config.jira_only)
+    
+    # If project specified, override the projects list on a copy so the
+    # cached configuration is left untouched
+    jira_config = config.jira
+    if project:
+        jira_config = replace(jira_config, projects=[project])
+    
+    try:
+        # Create JIRA client
+        jira_client = JiraClient(jira_config)
+    except ConfigError as e:
+        exit_with_config_errors(e.errors)
+    
+    try:
+        if project:
+            console.print(f"\n[bold]Fetching JIRA tickets for project {project} sorted by priority...[/bold]\n")
+        else:
+            console.print("\n[bold]Fetching JIRA tickets sorted by priority...[/bold]\n")
+        
+        # Stream all tickets (excluding done) so rows render as pages arrive
+        tickets = jira_client.iter_all_tickets(exclude_done=True)
+        
+        with console.status("Fetching tickets from JIRA..."):
+            first_ticket = next(tickets, None)
+        
+        if first_ticket is None:
+            console.print("[yellow]No tickets found in configured projects[/yellow]")
+            return
+        
+        # Create table
+        table = Table(title="JIRA Tickets")
+        table.add_column("Key", style="cyan", no_wrap=True)
+        table.add_column("Priority", style="magenta")
+        table.add_column("Status", style="yellow")
+        table.add_column("Assignee", style="green")
+        table.add_column("Summary", style="white")
+        
+        with Live(table, console=console, refresh_per_second=4):
+            for count, ticket in enumerate(chain([first_ticket], tickets), 1):
+                priority = ticket.get('priority', 'None')
+                priority_color = _PRIORITY_COLORS.get(priority, "white")
+                
+                table.add_row(
+                    ticket['key'],
+                    f"[{priority_color}]{priority}[/{priority_color}]",
+                    ticket['status'],
+                    ticket.get('assignee', 'Unassigned'),
+                    truncate(ticket['title'], 80)
+                )
+                table.title = f"JIRA Tickets ({count} total)"
+        
+    except Exception as e:
+        console.print(f"\n[red]Failed to fetch tickets: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,101 @@
+"""
+Command for listing Obsidian notes
+"""
+
+import re
+import sys
+
+import click
+
+from ..config import Config, ConfigError
+from . import exit_with_config_errors, get_console, load_config, truncate
+
+# Matches note names of the form "PROJ-123 Title.md"
+_TICKET_RE = re.compile(r'^([A-Z][A-Z0-9_]*)-(\d+)(?:\s|\.md)')
+
+
+@click.command()
+@click.option('--project', '-p', help='Filter by specific project key (e.g., PROJ)')
+def list_obsidian(project: str):
+    """List all Obsidian notes for JIRA tickets."""
+    from rich.table import Table
+
+    from ..obsidian_client import ObsidianClient
+
+    console = get_console()
+    config = load_config(Config.obsidian_only)
+    
+    try:
+        # Create Obsidian client
+        obsidian_client = ObsidianClient(config.obsidian)
+    except ConfigError as e:
+        exit_with_config_errors(e.errors)
+    
+    try:
+        if project:
+            console.print(f"\n[bold]Fetching Obsidian notes for project {project}...[/bold]\n")
+        else:
+            console.print(f"\n[bold]Fetching all Obsidian notes in {config.obsidian.folder} folder...[/bold]\n")
+        
+        # List all notes in the configured folder
+        notes = obsidian_client.list_notes()
+        
+        # Filter notes by project if specified
+        if project:
+            # Check if note name starts with project key
+            prefix = f"{project}-"
+            project_notes = [note for note in notes if note['name'].startswith(prefix)]
+        else:
+            # Show all notes
+            project_notes = notes
+        
+        if not project_notes:
+            if project:
+                console.print(f"[yellow]No notes found for project {project}[/yellow]")
+            else:
+                console.print(f"[yellow]No notes found in {config.obsidian.folder} folder[/yellow]")
+            return
+        
+        # Sort by ticket number
+        def extract_ticket_number(note):
+            # Extract number from format "PROJ-123 Title.md"
+            match = _TICKET_RE.match(note['name'])
+            return int(match.group(2)) if match else 0
+        
+        project_notes.sort(key=extract_ticket_number)
+        
+        # Create table
+        if project:
+            table = Table(title=f"Obsidian Notes for Project {project} ({len(project_notes)} total)")
+        else:
+            table = Table(title=f"All Obsidian Notes ({len(project_notes)} total)")
+        table.add_column("Ticket", style="cyan", no_wrap=True)
+        table.add_column("Title", style="white")
+        table.add_column("Path", style="dim")
+        
+        for note in project_notes:
+            # Extract ticket key and title from filename
+            name = note['name']
+            if name.endswith('.md'):
+                name = name[:-3]
+            
+            # Try to split into ticket and title
+            parts = name.split(' ', 1)
+            if len(parts) == 2:
+                ticket_key = parts[0]
+                title = parts[1]
+            else:
+                ticket_key = name
+                title = ""
+            
+            table.add_row(
+                ticket_key,
+                truncate(title, 60),
+                note['path']
+            )
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"\n[red]Failed to fetch notes: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,131 @@
+"""
+Command for syncing JIRA tickets to Obsidian
+"""
+
+import sys
+
+import click
+
+from ..config import ConfigError
+from . import exit_with_config_errors, get_console, load_config
+
+
+@click.command()
+@click.option('--ticket', '-t', help='Sync a specific ticket by key (e.g., PROJ-123)')
+@click.option('--dry-run', '-n', is_flag=True, help='Show what would be done without actually doing it')
+@click.option('--full', '-f', is_flag=True, help='Perform a full sync, ignoring last sync state')
+@click.option('--force', is_flag=True, help='Rewrite notes even if their ticket has not changed')
+def sync(ticket: str, dry_run: bool, full: bool, force: bool):
+    """Sync JIRA tickets to Obsidian."""
+    from rich.console import Group
+    from rich.padding import Padding
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from ..sync import JiraObsidianSync
+
+    console = get_console()
+    config = load_config(validate=True)
+    
+    # Create sync instance
+    try:
+        sync_instance = JiraObsidianSync(config)
+    except ConfigError as e:
+        exit_with_config_errors(e.errors)
+    
+    try:
+        if ticket:
+            # Sync single ticket
+            console.print(f"\n[bold]Syncing ticket {ticket}...[/bold]\n")
+            results = sync_instance.sync_single_ticket(ticket)
+            
+            if results["success"]:
+                if results["note_created"]:
+                    console.print(f"[green]✅ Created note for {ticket}[/green]")
+                elif results["note_updated"]:
+                    console.print(f"[green]✅ Updated note for {ticket}[/green]")
+            else:
+                console.print(f"[red]❌ Failed to sync {ticket}: {results.get('error', 'Unknown error')}[/red]")
+                sys.exit(1)
+        else:
+            # Sync all tickets
+            if dry_run:
+                console.print("\n[bold yellow]Starting JIRA to Obsidian sync (DRY RUN)...[/bold yellow]\n")
+            else:
+                if full:
+                    console.print("\n[bold]Starting JIRA to Obsidian FULL sync...[/bold]\n")
+                else:
+                    console.print("\n[bold]Starting JIRA to Obsidian incremental sync...[/bold]\n")
+            
+            results = sync_instance.sync(dry_run=dry_run, full_sync=full, force=force)
+            
+            # Display results
+            table = Table(title="Sync Results" + (" (DRY RUN)" if dry_run else ""))
+            table.add_column("Metric", style="cyan")
+            table.add_column("Value", style="white")
+            
+            table.add_row("Tickets Found", str(results["tickets_found"]))
+            table.add_row("Notes Created", str(results["notes_created"]))
+            table.add_row("Notes Updated", str(results["notes_updated"]))
+            table.add_row("Notes Skipped", str(results["notes_skipped"]))
+            table.add_row("Conflicts", str(len(results["conflicts"])))
+            table.add_row("Errors", str(len(results["errors"])))
+            
+            console.print(table)
+            
+            # In dry run mode, show what would be done
+            if dry_run and results.get("dry_run_actions"):
+                console.print("\n[bold yellow]DRY RUN - The following actions would be performed:[/bold yellow]\n")
+                
+                panels = []
+                for action in results["dry_run_actions"]:
+                    # Create a panel for each action
+                    panel_content = f"[cyan]Action:[/cyan] {action.action}\n"
+                    panel_content += f"[cyan]File Path:[/cyan] {action.file_path}\n"
+                    
+                    # Show old file path if this is a rename
+                    if action.old_file_path:
+                        panel_content += f"[cyan]Old File Path:[/cyan] {action.old_file_path}\n"
+                    
+                    panel_content += f"[cyan]HTTP Method:[/cyan] {action.http_method}\n"
+                    panel_content += f"[cyan]API Endpoint:[/cyan] {action.api_endpoint}\n"
+                    panel_content += f"[cyan]Content Length:[/cyan] {action.content_length} bytes\n"
+                    panel_content += f"\n[cyan]Headers:[/cyan]\n"
+                    for header, value in action.headers.items():
+                        panel_content += f"  {header}: {value}\n"
+                    panel_content += f"\n[cyan]Content Preview:[/cyan]\n"
+                    panel_content += f"{action.content_preview}"
+                    
+                    panel = Panel(
+                        panel_content,
+                        title=f"[bold]{action.ticket}[/bold]",
+                        border_style="yellow"
+                    )
+                    # Add spacing between panels
+                    panels.append(Padding(panel, (0, 0, 1, 0)))
+                
+                console.print(Group(*panels))
+            
+            if results["conflicts"]:
+                console.print("\n[yellow]Notes edited in Obsidian were not overwritten:[/yellow]")
+                for conflict in results["conflicts"]:
+                    console.print(f"  • {conflict}")
+                console.print("To overwrite them, run [bold]j2o sync --ticket KEY[/bold] or [bold]j2o sync --full --force[/bold]")
+            
+            if results["errors"]:
+                console.print("\n[red]Errors encountered:[/red]")
+                for error in results["errors"]:
+                    console.print(f"  • {error}")
+            
+            if results["success"]:
+                if dry_run:
+                    console.print("\n[bold yellow]✅ Dry run completed successfully![/bold yellow]")
+                else:
+                    console.print("\n[bold green]✅ Sync completed successfully![/bold green]")
+            else:
+                console.print("\n[bold red]❌ Sync completed with errors[/bold red]")
+                sys.exit(1)
+                
+    except Exception as e:
+        console.print(f"\n[red]Sync failed: {e}[/red]")
+        sys.exit(1)
@@ -2,11 +2,18 @@
 Configuration management for JIRA to Obsidian sync
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import List, Optional
 
-from dotenv import load_dotenv
+
+class ConfigError(ValueError):
+    """Raised when configuration is missing or invalid."""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
 
 
 @dataclass
@@ -17,16 +24,18 @@ class JiraConfig:
     email: str
     api_token: str
     projects: List[str]
+    max_workers: int = 5
     
     @classmethod
     def from_env(cls) -> "JiraConfig":
         """Create JiraConfig from environment variables."""
-        server = os.getenv("JIRA_SERVER", "").rstrip("/")
-        email = os.getenv("JIRA_EMAIL", "")
-        api_token = os.getenv("JIRA_API_TOKEN", "")
+        env = os.environ
+        server = env.get("JIRA_SERVER", "").rstrip("/")
+        email = env.get("JIRA_EMAIL", "")
+        api_token = env.get("JIRA_API_TOKEN", "")
         projects = [
             p.strip() 
-            for p in os.getenv("JIRA_PROJECTS", "").split(",") 
+            for p in env.get("JIRA_PROJECTS", "").split(",") 
             if p.strip()
         ]
         
@@ -34,7 +43,8 @@ class JiraConfig:
             server=server,
             email=email,
             api_token=api_token,
-            projects=projects
+            projects=projects,
+            max_workers=int(env.get("JIRA_MAX_WORKERS", "5"))
         )
     
     def validate(self) -> List[str]:
@@ -49,6 +59,8 @@ class JiraConfig:
             errors.append("JIRA_API_TOKEN is required")
         if not self.projects:
             errors.append("JIRA_PROJECTS is required (comma-separated list)")
+        if self.max_workers < 1:
+            errors.append("JIRA_MAX_WORKERS must be at least 1")
             
         return errors
 
@@ -61,15 +73,18 @@ class ObsidianConfig:
     api_key: str
     folder: str
     update_existing: bool
+    max_workers: int = 8
     
     @classmethod
     def from_env(cls) -> "ObsidianConfig":
         """Create ObsidianConfig from environment variables."""
+        env = os.environ
         return cls(
-            api_url=os.getenv("OBSIDIAN_API_URL", "http://localhost:27123").rstrip("/"),
-            api_key=os.getenv("OBSIDIAN_API_KEY", ""),
-            folder=os.getenv("OBSIDIAN_FOLDER", "JIRA"),
-            update_existing=os.getenv("UPDATE_EXISTING_NOTES", "true").lower() == "true"
+            api_url=env.get("OBSIDIAN_API_URL", "http://localhost:27123").rstrip("/"),
+            api_key=env.get("OBSIDIAN_API_KEY", ""),
+            folder=env.get("OBSIDIAN_FOLDER", "JIRA"),
+            update_existing=env.get("UPDATE_EXISTING_NOTES", "true").lower() == "true",
+            max_workers=int(env.get("OBSIDIAN_MAX_WORKERS", "8"))
         )
     
     def validate(self) -> List[str]:
@@ -78,6 +93,8 @@ class ObsidianConfig:
         
         if not self.api_key:
             errors.append("OBSIDIAN_API_KEY is required")
+        if self.max_workers < 1:
+            errors.append("OBSIDIAN_MAX_WORKERS must be at least 1")
             
         return errors
 
@@ -86,26 +103,60 @@ class ObsidianConfig:
 class Config:
     """Complete application configuration."""
     
-    jira: JiraConfig
-    obsidian: ObsidianConfig
+    jira: Optional[JiraConfig]
+    obsidian: Optional[ObsidianConfig]
     sync_interval_minutes: int
     
     @classmethod
     def from_env(cls) -> "Config":
         """Create Config from environment variables."""
-        load_dotenv()
-        
         return cls(
             jira=JiraConfig.from_env(),
             obsidian=ObsidianConfig.from_env(),
             sync_interval_minutes=int(os.getenv("SYNC_INTERVAL_MINUTES", "5"))
         )
     
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def load(cls) -> "Config":
+        """Load Config from the environment once and reuse it afterwards."""
+        return cls.from_env()
+    
+    @classmethod
+    def jira_only(cls) -> "Config":
+        """Create Config with only the JIRA settings loaded."""
+        return cls(
+            jira=JiraConfig.from_env(),
+            obsidian=None,
+            sync_interval_minutes=int(os.getenv("SYNC_INTERVAL_MINUTES", "5"))
+        )
+    
+    @classmethod
+    def obsidian_only(cls) -> "Config":
+        """Create Config with only the Obsidian settings loaded."""
+        return cls(
+            jira=None,
+            obsidian=ObsidianConfig.from_env(),
+            sync_interval_minutes=int(os.getenv("SYNC_INTERVAL_MINUTES", "5"))
+        )
+    
+    def validate_jira(self) -> List[str]:
+        """Validate JIRA configuration and return list of errors."""
+        if self.jira is None:
+            return ["JIRA configuration was not loaded"]
+        return self.jira.validate()
+    
+    def validate_obsidian(self) -> List[str]:
+        """Validate Obsidian configuration and return list of errors."""
+        if self.obsidian is None:
+            return ["Obsidian configuration was not loaded"]
+        return self.obsidian.validate()
+    
     def validate(self) -> List[str]:
         """Validate all configuration and return list of errors."""
         errors = []
-        errors.extend(self.jira.validate())
-        errors.extend(self.obsidian.validate())
+        errors.extend(self.validate_jira())
+        errors.extend(self.validate_obsidian())
         
         if self.sync_interval_minutes < 1:
             errors.append("SYNC_INTERVAL_MINUTES must be at least 1")
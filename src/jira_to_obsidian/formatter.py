@@ -2,11 +2,86 @@
 Formatters for converting JIRA tickets to Obsidian notes
 """
 
+import functools
+import hashlib
+import io
+import re
 from datetime import datetime
 from typing import Dict, List
 
 from dateutil import parser
 
+# Characters that are problematic in note filenames
+_TITLE_TRANS = str.maketrans({
+    '/': '-',      # Forward slash would create subdirectories
+    '\\': '-',     # Backslash could cause issues
+    ':': '-',      # Colon is problematic on Windows
+    '*': '-',      # Asterisk is not allowed in filenames
+    '?': '-',      # Question mark is not allowed
+    '"': "'",      # Double quotes not allowed
+    '<': '-',      # Less than not allowed
+    '>': '-',      # Greater than not allowed
+    '|': '-',      # Pipe not allowed
+    '\n': ' ',     # Newlines replaced with space
+    '\r': ' ',     # Carriage returns replaced with space
+    '\t': ' ',     # Tabs replaced with space
+})
+
+_WS_RE = re.compile(r' {2,}')
+
+# Basic JIRA wiki markup to Markdown conversions, applied in order. Lists run
+# before headers so the "# " a header becomes isn't read as a numbered list,
+# and bold runs before italic so the "*" italic becomes isn't read as bold.
+_JIRA_PATTERNS = [
+    # Lists, keeping their nesting depth
+    (re.compile(r'^(\*+) ', re.M), lambda m: '  ' * (len(m.group(1)) - 1) + '- '),
+    (re.compile(r'^(#+) ', re.M), lambda m: '   ' * (len(m.group(1)) - 1) + '1. '),
+    # Headers
+    (re.compile(r'^h([1-6])\.\s+', re.M), lambda m: '#' * int(m.group(1)) + ' '),
+    # Text formatting, only around words so e.g. snake_case and dates survive
+    (re.compile(r'(?<!\w)\*(?=\S)([^*\n]+?)(?<=\S)\*(?!\w)'), r'**\1**'),
+    (re.compile(r'(?<!\w)_(?=\S)([^_\n]+?)(?<=\S)_(?!\w)'), r'*\1*'),
+    (re.compile(r'(?<!\w)\+(?=\S)([^+\n]+?)(?<=\S)\+(?!\w)'), r'<u>\1</u>'),
+    (re.compile(r'(?<![\w-])-(?=\S)([^-\n]+?)(?<=\S)-(?![\w-])'), r'~~\1~~'),
+    # Code, keeping the language of {code:java} but not a parameter like {code:title=Foo.java}
+    (re.compile(r'\{code(?::([\w+#-]+)(?=[|}]))?[^}]*\}'), r'```\1'),
+    (re.compile(r'\{noformat\}'), '```'),
+]
+
+# The frontmatter's updated time moves with every JIRA edit, including edits to
+# fields the note doesn't show, so it is left out of the content hash
+_UPDATED_RE = re.compile(r'^updated: .*$', re.M)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> datetime:
+    """Parse a date string, trying the C ISO-8601 parser before dateutil."""
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return parser.parse(date_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _jira_to_markdown(text: str) -> str:
+    """Run the JIRA markup conversions; comments rarely change between syncs."""
+    for pattern, replacement in _JIRA_PATTERNS:
+        text = pattern.sub(replacement, text)
+    
+    return text
+
+
+@functools.lru_cache(maxsize=128)
+def _project_tag(project: str) -> str:
+    """Return the Obsidian tag for a project key."""
+    return project.lower()
+
+
+@functools.lru_cache(maxsize=128)
+def _status_tag(status: str) -> str:
+    """Return the Obsidian tag for a status name."""
+    return status.lower().replace(' ', '-')
+
 
 class TicketFormatter:
     """Format JIRA tickets as Obsidian markdown notes."""
@@ -23,185 +98,208 @@ class TicketFormatter:
             Tuple of (note_title, note_content)
         """
         note_title = self._format_title(ticket)
-        note_content = self._format_content(ticket)
+        note_content = self._format_content(ticket, note_title)
         
         return note_title, note_content
     
+    def content_hash(self, note_content: str) -> str:
+        """
+        Hash a rendered note to tell whether it needs rewriting.
+        
+        Args:
+            note_content: Note content from format_note
+            
+        Returns:
+            Hex digest that ignores the frontmatter's updated time
+        """
+        stable = _UPDATED_RE.sub('', note_content, count=1)
+        return hashlib.blake2b(stable.encode('utf-8'), digest_size=16).hexdigest()
+    
     def _format_title(self, ticket: Dict) -> str:
         """Format the note title."""
         # Sanitize title to avoid filesystem issues
-        safe_title = ticket['title']
-        
-        # Replace problematic characters
-        replacements = {
-            '/': '-',      # Forward slash would create subdirectories
-            '\\': '-',     # Backslash could cause issues
-            ':': '-',      # Colon is problematic on Windows
-            '*': '-',      # Asterisk is not allowed in filenames
-            '?': '-',      # Question mark is not allowed
-            '"': "'",      # Double quotes not allowed
-            '<': '-',      # Less than not allowed
-            '>': '-',      # Greater than not allowed
-            '|': '-',      # Pipe not allowed
-            '\n': ' ',     # Newlines replaced with space
-            '\r': ' ',     # Carriage returns replaced with space
-            '\t': ' ',     # Tabs replaced with space
-        }
-        
-        for old_char, new_char in replacements.items():
-            safe_title = safe_title.replace(old_char, new_char)
-        
-        # Remove any double spaces that might have been created
-        while '  ' in safe_title:
-            safe_title = safe_title.replace('  ', ' ')
-        
-        # Trim whitespace
-        safe_title = safe_title.strip()
+        safe_title = ticket['title'].translate(_TITLE_TRANS)
+        
+        # Collapse any runs of spaces that might have been created and trim
+        safe_title = _WS_RE.sub(' ', safe_title).strip()
         
         return f"{ticket['project']}-{ticket['key'].split('-')[1]} {safe_title}"
     
-    def _format_content(self, ticket: Dict) -> str:
+    def _format_content(self, ticket: Dict, title: str) -> str:
         """Format the note content."""
-        title = self._format_title(ticket)
-        sections = []
+        buf = io.StringIO()
         
         # YAML frontmatter
-        frontmatter = self._format_yaml_frontmatter(ticket)
-        sections.append(frontmatter)
+        self._write_yaml_frontmatter(buf, ticket)
         
         # Header
-        sections.append(f"# {title}")
+        buf.write(f"\n\n# {title}")
         
         # Description section
-        description = self._format_description(ticket)
-        sections.append("## Description")
-        sections.append(description)
+        buf.write("\n\n## Description\n\n")
+        self._write_description(buf, ticket)
         
         # Comments section
-        comments = self._format_comments(ticket.get('comments', []))
+        comments = ticket.get('comments', [])
         if comments:
-            sections.append("## Comments")
-            sections.append(comments)
+            buf.write("\n\n## Comments\n\n")
+            self._write_comments(buf, comments)
         
         # Footer with JIRA link
-        sections.append(self._format_footer(ticket))
+        buf.write("\n\n")
+        self._write_footer(buf, ticket)
         
-        return '\n\n'.join(sections)
+        return buf.getvalue()
     
     def _format_yaml_frontmatter(self, ticket: Dict) -> str:
         """Format metadata as YAML frontmatter."""
-        lines = ["---"]
-        
-        # Aliases - allows linking with [[PROJ-123]]
-        lines.append(f"aliases:")
-        lines.append(f"  - {ticket['key']}")
-        
-        # Basic metadata
+        buf = io.StringIO()
+        self._write_yaml_frontmatter(buf, ticket)
+        return buf.getvalue()
+    
+    def _write_yaml_frontmatter(self, buf: io.StringIO, ticket: Dict):
+        """Write metadata as YAML frontmatter."""
         # Add wikilinks for assignee and reporter if they're actual people
         assignee = ticket['assignee']
         if assignee not in ['Unassigned', 'Unknown', '']:
             assignee = f'"[[{assignee}]]"'
-        lines.append(f"assignee: {assignee}")
         
         reporter = ticket['reporter']
         if reporter not in ['Unassigned', 'Unknown', '']:
             reporter = f'"[[{reporter}]]"'
-        lines.append(f"reporter: {reporter}")
-        lines.append(f"priority: {ticket['priority']}")
-        lines.append(f"status: {ticket['status']}")
-        lines.append(f"project: {ticket['project']}")
-        lines.append(f"key: {ticket['key']}")
+        
+        # Aliases - allows linking with [[PROJ-123]] - and basic metadata
+        buf.write(
+            f"---\n"
+            f"aliases:\n"
+            f"  - {ticket['key']}\n"
+            f"assignee: {assignee}\n"
+            f"reporter: {reporter}\n"
+            f"priority: {ticket['priority']}\n"
+            f"status: {ticket['status']}\n"
+            f"project: {ticket['project']}\n"
+            f"key: {ticket['key']}\n"
+        )
         
         # Optional metadata
         if ticket.get('story_points') is not None:
-            lines.append(f"story_points: {ticket['story_points']}")
+            buf.write(f"story_points: {ticket['story_points']}\n")
         
         if ticket.get('sprint'):
-            lines.append(f"sprint: {ticket['sprint']}")
+            buf.write(f"sprint: {ticket['sprint']}\n")
         
         # Dates
-        lines.append(f"created: {self._format_date(ticket['created'])}")
+        buf.write(f"created: {self._format_date(ticket['created'])}\n")
         
         if ticket.get('due_date'):
-            lines.append(f"due_date: {ticket['due_date']}")
-            
-        lines.append(f"updated: {self._format_date(ticket['updated'])}")
-        
-        # Tags for Obsidian
-        lines.append(f"tags:")
-        lines.append(f"  - jira")
-        lines.append(f"  - {ticket['project'].lower()}")
-        lines.append(f"  - {ticket['status'].lower().replace(' ', '-')}")
-        
-        lines.append("---")
-        
-        return '\n'.join(lines)
+            buf.write(f"due_date: {ticket['due_date']}\n")
+        
+        # Last updated and tags for Obsidian
+        buf.write(
+            f"updated: {self._format_date(ticket['updated'])}\n"
+            f"tags:\n"
+            f"  - jira\n"
+            f"  - {_project_tag(ticket['project'])}\n"
+            f"  - {_status_tag(ticket['status'])}\n"
+            f"---"
+        )
     
     def _format_metadata(self, ticket: Dict) -> str:
         """Format the metadata section."""
-        lines = []
-        
+        buf = io.StringIO()
+        self._write_metadata(buf, ticket)
+        return buf.getvalue()
+    
+    def _write_metadata(self, buf: io.StringIO, ticket: Dict):
+        """Write the metadata section."""
         # Basic metadata
-        lines.append(f"- **Assignee**: [[{ticket['assignee']}]]")
-        lines.append(f"- **Reporter**: [[{ticket['reporter']}]]")
-        lines.append(f"- **Priority**: {ticket['priority']}")
-        lines.append(f"- **Status**: {ticket['status']}")
+        buf.write(
+            f"- **Assignee**: [[{ticket['assignee']}]]\n"
+            f"- **Reporter**: [[{ticket['reporter']}]]\n"
+            f"- **Priority**: {ticket['priority']}\n"
+            f"- **Status**: {ticket['status']}\n"
+        )
         
         # Optional metadata
         if ticket.get('story_points'):
-            lines.append(f"- **Story Points**: {ticket['story_points']}")
+            buf.write(f"- **Story Points**: {ticket['story_points']}\n")
         
         if ticket.get('sprint'):
-            lines.append(f"- **Sprint**: {ticket['sprint']}")
+            buf.write(f"- **Sprint**: {ticket['sprint']}\n")
         
         # Dates
-        lines.append(f"- **Created**: {self._format_date(ticket['created'])}")
+        buf.write(f"- **Created**: {self._format_date(ticket['created'])}\n")
         
         if ticket.get('due_date'):
-            lines.append(f"- **Due Date**: {ticket['due_date']}")
-        
-        lines.append(f"- **Last Updated**: {self._format_date(ticket['updated'])}")
+            buf.write(f"- **Due Date**: {ticket['due_date']}\n")
         
-        return '\n'.join(lines)
+        buf.write(f"- **Last Updated**: {self._format_date(ticket['updated'])}")
     
     def _format_description(self, ticket: Dict) -> str:
         """Format the description section."""
+        buf = io.StringIO()
+        self._write_description(buf, ticket)
+        return buf.getvalue()
+    
+    def _write_description(self, buf: io.StringIO, ticket: Dict):
+        """Write the description section."""
         description = ticket.get('description', '').strip()
         
         if not description:
-            return "*No description provided*"
+            buf.write("*No description provided*")
+            return
         
         # Convert JIRA formatting to Markdown if needed
-        description = self._convert_jira_to_markdown(description)
-        
-        return description
+        buf.write(self._convert_jira_to_markdown(description))
     
     def _format_comments(self, comments: List[Dict]) -> str:
         """Format the comments section."""
-        if not comments:
-            return ""
-        
-        formatted_comments = []
+        buf = io.StringIO()
+        self._write_comments(buf, comments)
+        return buf.getvalue()
+    
+    def _write_comments(self, buf: io.StringIO, comments: List[Dict]):
+        """Write the comments section."""
+        separator = ""
         
         for comment in comments:
             date = self._format_date(comment['created'])
             author = comment['author']
             body = self._convert_jira_to_markdown(comment['body'])
             
-            formatted_comments.append(f"### {author} - {date}\n\n{body}")
-        
-        return '\n\n'.join(formatted_comments)
+            buf.write(f"{separator}### {author} - {date}\n\n{body}")
+            separator = "\n\n"
     
     def _format_footer(self, ticket: Dict) -> str:
         """Format the footer with JIRA link."""
-        return f"---\n[View in JIRA]({self.jira_server}/browse/{ticket['key']})"
+        buf = io.StringIO()
+        self._write_footer(buf, ticket)
+        return buf.getvalue()
+    
+    def _write_footer(self, buf: io.StringIO, ticket: Dict):
+        """Write the footer with JIRA link."""
+        buf.write(f"---\n[View in JIRA]({self.jira_server}/browse/{ticket['key']})")
     
     def _format_date(self, date_str: str) -> str:
         """Format date string for display."""
+        if not date_str:
+            return ''
+        
+        # JIRA timestamps are ISO-8601 ("2024-01-01T15:30:45.000+0000") and
+        # are shown in their own offset, so the display form is a slice
+        if (
+            len(date_str) >= 16
+            and date_str[4] == '-'
+            and date_str[7] == '-'
+            and date_str[10] == 'T'
+            and date_str[13] == ':'
+        ):
+            return f"{date_str[:10]} {date_str[11:16]}"
+        
         try:
-            date = parser.parse(date_str)
+            date = _parse_date(date_str)
             return date.strftime('%Y-%m-%d %H:%M')
-        except Exception:
+        except (ValueError, OverflowError):
             return date_str
     
     def _convert_jira_to_markdown(self, text: str) -> str:
@@ -209,31 +307,4 @@ class TicketFormatter:
         if not text:
             return ""
         
-        # Basic conversions
-        conversions = {
-            # Headers
-            'h1. ': '# ',
-            'h2. ': '## ',
-            'h3. ': '### ',
-            'h4. ': '#### ',
-            'h5. ': '##### ',
-            'h6. ': '###### ',
-            # Text formatting
-            '*bold*': '**bold**',
-            '_italic_': '*italic*',
-            '+underline+': '<u>underline</u>',
-            '-strikethrough-': '~~strikethrough~~',
-            # Lists
-            '* ': '- ',
-            '# ': '1. ',
-            # Code
-            '{code}': '```',
-            '{code:': '```',
-            '{noformat}': '```',
-        }
-        
-        result = text
-        for jira_format, markdown_format in conversions.items():
-            result = result.replace(jira_format, markdown_format)
-        
-        return result
\ No newline at end of file
+        return _jira_to_markdown(text)
\ No newline at end of file
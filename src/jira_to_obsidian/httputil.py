@@ -0,0 +1,38 @@
+"""
+Shared HTTP connection pool and retry settings
+"""
+
+from typing import Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry transient failures with exponential backoff; once retries run out the
+# last response is returned so callers still see its status code. Refused
+# connections fail at once, since backing off won't start a stopped server
+RETRY = Retry(
+    total=5,
+    connect=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'PUT', 'DELETE', 'HEAD']),
+    raise_on_status=False
+)
+
+
+def build_adapter(pool_maxsize: int = 20, retry: Optional[Retry] = RETRY) -> HTTPAdapter:
+    """
+    Build a keep-alive adapter whose pool fits the given number of concurrent requests.
+    
+    Args:
+        pool_maxsize: Connections kept open per host, at least 20
+        retry: Retry policy to apply (None = no retries)
+        
+    Returns:
+        Configured HTTPAdapter
+    """
+    return HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=max(20, pool_maxsize),
+        max_retries=retry if retry is not None else 0
+    )
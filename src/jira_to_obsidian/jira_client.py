@@ -3,22 +3,68 @@ JIRA client for fetching tickets
 """
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import partial
+from itertools import chain
+from operator import attrgetter
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from jira import JIRA
 from jira.exceptions import JIRAError
 
-from .config import JiraConfig
+from .config import ConfigError, JiraConfig
+from .httputil import build_adapter
 
 logger = logging.getLogger(__name__)
 
+# Sprint name in the legacy "com.atlassian.greenhopper...Sprint@...[id=1,name=Sprint 1,...]" form
+_SPRINT_NAME_RE = re.compile(r'name=([^,\]]+)')
+
+
+def _jql_timestamp(value: datetime) -> str:
+    """Quote a datetime the way JQL expects it ("yyyy-MM-dd HH:mm")."""
+    return f'"{value.strftime("%Y-%m-%d %H:%M")}"'
+
 
 class JiraClient:
     """Client for interacting with JIRA."""
     
+    # Fields read by _extract_ticket_data, requested explicitly so searches
+    # also return each issue's comments
+    TICKET_FIELDS = (
+        "project,summary,description,assignee,reporter,priority,status,"
+        "created,updated,duedate,customfield_10016,customfield_10020,comment"
+    )
+    
+    # Statuses treated as finished; these tickets are not synced
+    DONE_STATUSES = ("Done", "Resolved", "Closed")
+    
+    # (ticket key, accessor) pairs applied to issue.fields, built once rather
+    # than probing attributes by name for every issue
+    _FIELD_ACCESSORS = (
+        ('title', attrgetter('summary')),
+        ('description', lambda f: f.description or ''),
+        ('assignee', lambda f: f.assignee.displayName if f.assignee else 'Unassigned'),
+        ('assignee_email', lambda f: getattr(f.assignee, 'emailAddress', None) if f.assignee else None),
+        ('reporter', lambda f: f.reporter.displayName if f.reporter else 'Unknown'),
+        ('reporter_email', lambda f: getattr(f.reporter, 'emailAddress', None) if f.reporter else None),
+        ('priority', lambda f: f.priority.name if f.priority else 'None'),
+        ('status', attrgetter('status.name')),
+        ('created', attrgetter('created')),
+        ('updated', attrgetter('updated')),
+        ('due_date', lambda f: getattr(f, 'duedate', None) or None),
+        # Story points (custom field - may vary by instance)
+        ('story_points', lambda f: getattr(f, 'customfield_10016', None) or None),
+    )
+    
     def __init__(self, config: JiraConfig):
         """Initialize JIRA client with configuration."""
+        errors = config.validate()
+        if errors:
+            raise ConfigError(errors)
+        
         self.config = config
         self._client: Optional[JIRA] = None
         
@@ -26,10 +72,18 @@ class JiraClient:
     def client(self) -> JIRA:
         """Get or create JIRA client instance."""
         if self._client is None:
+            # Skip the server info request the library makes on construction
             self._client = JIRA(
                 server=self.config.server,
-                basic_auth=(self.config.email, self.config.api_token)
+                basic_auth=(self.config.email, self.config.api_token),
+                get_server_info=False
             )
+            
+            # The library's own session carries auth and already retries
+            # 429/5xx, so only widen its pool for concurrent page fetches
+            adapter = build_adapter(self.config.max_workers, retry=None)
+            self._client._session.mount("https://", adapter)
+            self._client._session.mount("http://", adapter)
         return self._client
     
     def test_connection(self) -> Dict[str, any]:
@@ -77,8 +131,64 @@ class JiraClient:
                 "error": f"Unexpected error: {str(e)}"
             }
     
-    def get_in_progress_tickets(self) -> List[Dict]:
-        """Fetch all in-progress tickets from configured projects."""
+    def get_ticket(self, ticket_key: str) -> Optional[Dict]:
+        """
+        Fetch a single ticket by key.
+        
+        Args:
+            ticket_key: The JIRA ticket key (e.g., "PROJ-123")
+            
+        Returns:
+            Ticket dictionary, or None if the ticket was not found
+        """
+        issues = self.client.search_issues(
+            f'key = "{ticket_key}"',
+            maxResults=1,
+            fields=self.TICKET_FIELDS
+        )
+        
+        if not issues:
+            return None
+        
+        return self._extract_ticket_data(issues[0])
+    
+    def get_done_ticket_keys(self, since: datetime) -> Set[str]:
+        """
+        Fetch the keys of tickets that were moved to a done status.
+        
+        Args:
+            since: Only tickets updated at or after this time are considered
+            
+        Returns:
+            Set of ticket keys now in one of DONE_STATUSES
+        """
+        if not self.config.projects:
+            return set()
+        
+        jql = (
+            f"project in ({','.join(self.config.projects)})"
+            f" AND status IN ({', '.join(self.DONE_STATUSES)})"
+            f" AND updated >= {_jql_timestamp(since)}"
+        )
+        
+        batch_size = 100
+        # Only the issue keys are needed, so skip every field
+        search = partial(self.client.search_issues, jql, maxResults=batch_size, fields="key")
+        pages = self._iter_pages(search, batch_size, None, True, self.config.max_workers)
+        
+        return {issue.key for issue in chain.from_iterable(pages)}
+    
+    def get_in_progress_tickets(self, fields: Optional[str] = None, expand: Optional[str] = None) -> List[Dict]:
+        """
+        Fetch all in-progress tickets from configured projects.
+        
+        Args:
+            fields: Comma-separated fields to request (default: TICKET_FIELDS)
+            expand: Optional JIRA expand parameter (e.g. "changelog")
+            
+        Returns:
+            List of ticket dictionaries
+        """
         if not self.config.projects:
             return []
         
@@ -92,7 +202,8 @@ class JiraClient:
             issues = self.client.search_issues(
                 jql,
                 maxResults=100,
-                expand='changelog'
+                fields=fields or self.TICKET_FIELDS,
+                expand=expand
             )
             
             tickets = []
@@ -107,7 +218,19 @@ class JiraClient:
             logger.error(f"Error fetching JIRA tickets: {e}")
             raise
     
-    def get_all_tickets(self, max_results: Optional[int] = None, order_by: str = "priority DESC", exclude_done: bool = True) -> List[Dict]:
+    def get_all_tickets(
+        self,
+        max_results: Optional[int] = None,
+        *,
+        order_by: str = "priority DESC",
+        exclude_done: bool = True,
+        fields: Optional[str] = None,
+        expand: Optional[str] = None,
+        parallel: bool = True,
+        max_workers: Optional[int] = None,
+        should_extract: Optional[Callable[[str, str], bool]] = None,
+        since: Optional[datetime] = None
+    ) -> List[Dict]:
         """
         Fetch all tickets from configured projects with pagination support.
         
@@ -115,124 +238,263 @@ class JiraClient:
             max_results: Maximum number of tickets to fetch (None = all tickets)
             order_by: JQL ORDER BY clause (default: "priority DESC")
             exclude_done: If True, exclude tickets with Done status (default: True)
+            fields: Comma-separated fields to request (default: TICKET_FIELDS)
+            expand: Optional JIRA expand parameter (e.g. "changelog")
+            parallel: If True, fetch pages concurrently (default: True)
+            max_workers: Maximum number of concurrent page requests (default: JIRA_MAX_WORKERS)
+            should_extract: Optional predicate taking (key, updated); issues it
+                rejects are skipped before their fields are extracted
+            since: If set, only fetch tickets updated at or after this time
             
         Returns:
             List of ticket dictionaries sorted by the specified order
         """
+        return list(self.iter_all_tickets(
+            max_results,
+            order_by=order_by,
+            exclude_done=exclude_done,
+            fields=fields,
+            expand=expand,
+            parallel=parallel,
+            max_workers=max_workers,
+            should_extract=should_extract,
+            since=since
+        ))
+    
+    def iter_all_tickets(
+        self,
+        max_results: Optional[int] = None,
+        *,
+        order_by: str = "priority DESC",
+        exclude_done: bool = True,
+        fields: Optional[str] = None,
+        expand: Optional[str] = None,
+        parallel: bool = True,
+        max_workers: Optional[int] = None,
+        should_extract: Optional[Callable[[str, str], bool]] = None,
+        since: Optional[datetime] = None
+    ) -> Iterator[Dict]:
+        """
+        Iterate over all tickets from configured projects, page by page.
+        
+        Tickets are yielded in order as each page arrives, so callers can
+        start working before the full result set has been fetched. When
+        parallel is set, the pages after the first are fetched concurrently.
+        
+        Args:
+            max_results: Maximum number of tickets to fetch (None = all tickets)
+            order_by: JQL ORDER BY clause (default: "priority DESC")
+            exclude_done: If True, exclude tickets with Done status (default: True)
+            fields: Comma-separated fields to request (default: TICKET_FIELDS)
+            expand: Optional JIRA expand parameter (e.g. "changelog")
+            parallel: If True, fetch remaining pages with a thread pool (default: True)
+            max_workers: Maximum number of concurrent page requests (default: JIRA_MAX_WORKERS)
+            should_extract: Optional predicate taking (key, updated); issues it
+                rejects are skipped before their fields are extracted
+            since: If set, only fetch tickets updated at or after this time
+            
+        Yields:
+            Ticket dictionaries in the specified order
+        """
         if not self.config.projects:
-            return []
+            return
         
         # Build JQL query
-        project_filter = f"project in ({','.join(self.config.projects)})"
+        filters = [f"project in ({','.join(self.config.projects)})"]
+        
+        if since:
+            filters.append(f'updated >= {_jql_timestamp(since)}')
         
         if exclude_done:
             # Exclude Done, Resolved, Closed statuses
-            jql = f"{project_filter} AND status NOT IN (Done, Resolved, Closed) ORDER BY {order_by}"
-        else:
-            jql = f"{project_filter} ORDER BY {order_by}"
+            filters.append(f"status NOT IN ({', '.join(self.DONE_STATUSES)})")
+        
+        jql = f"{' AND '.join(filters)} ORDER BY {order_by}"
         
         logger.info(f"Fetching tickets with JQL: {jql}")
         
         try:
-            all_tickets = []
-            start_at = 0
-            batch_size = 50  # JIRA performs better with smaller batches
+            fetched = 0
+            batch_size = 100  # Upper bound on an issue search page; JIRA may return fewer
+            search = partial(
+                self.client.search_issues,
+                jql,
+                maxResults=batch_size,
+                fields=fields or self.TICKET_FIELDS,
+                expand=expand
+            )
             
-            while True:
-                # Fetch a batch of issues
-                logger.debug(f"Fetching tickets starting at {start_at}")
-                issues = self.client.search_issues(
-                    jql,
-                    startAt=start_at,
-                    maxResults=batch_size,
-                    expand='changelog'
-                )
-                
+            pages = self._iter_pages(
+                search,
+                batch_size,
+                max_results,
+                parallel,
+                max_workers or self.config.max_workers
+            )
+            for issues in pages:
                 # Process this batch
                 for issue in issues:
-                    ticket_data = self._extract_ticket_data(issue)
-                    all_tickets.append(ticket_data)
-                
-                # Check if we've reached the user-specified limit
-                if max_results and len(all_tickets) >= max_results:
-                    logger.info(f"Reached max_results limit of {max_results}")
-                    return all_tickets[:max_results]
+                    if should_extract and not should_extract(*self._extract_ticket_header(issue)):
+                        continue
+                    
+                    yield self._extract_ticket_data(issue)
+                    fetched += 1
+                    
+                    # Check if we've reached the user-specified limit
+                    if max_results and fetched >= max_results:
+                        logger.info(f"Reached max_results limit of {max_results}")
+                        return
                 
-                # Check if we have more pages
-                if len(issues) < batch_size:
-                    break  # No more pages
-                
-                start_at += batch_size
-                logger.info(f"Fetched {len(all_tickets)} tickets so far...")
+                logger.info(f"Fetched {fetched} tickets so far...")
             
-            logger.info(f"Found {len(all_tickets)} total tickets")
-            return all_tickets
+            logger.info(f"Found {fetched} total tickets")
             
         except JIRAError as e:
             logger.error(f"Error fetching JIRA tickets: {e}")
             raise
     
-    def get_updated_tickets(self, since: datetime, exclude_done: bool = True) -> List[Dict]:
+    def _iter_pages(self, search: Callable, batch_size: int, limit: Optional[int], parallel: bool, max_workers: int) -> Iterator[List]:
         """
-        Fetch tickets updated since a specific time.
+        Yield pages of search results in order.
+        
+        JIRA may return fewer issues than batch_size, so pages are stepped by
+        the size of the first page actually returned. Its total lets the rest
+        be requested concurrently. Without that total, or with parallel off,
+        pages are fetched one after another until the total is reached, or
+        until a short page comes back when the total is unknown.
         
         Args:
-            since: Datetime to fetch tickets updated after
-            exclude_done: If True, exclude tickets with Done status (default: True)
+            search: search_issues bound to the query, taking startAt
+            batch_size: Issues requested per page
+            limit: Stop after this many issues (None = all)
+            parallel: If True, fetch remaining pages with a thread pool
+            max_workers: Maximum number of concurrent page requests
             
-        Returns:
-            List of ticket dictionaries updated since the given time
+        Yields:
+            Lists of issues, one per page
         """
-        if not self.config.projects:
-            return []
+        logger.debug("Fetching tickets starting at 0")
+        page = search(startAt=0)
+        yield page
         
-        # Build JQL query with date filter
-        project_filter = f"project in ({','.join(self.config.projects)})"
-        
-        # Format datetime for JQL (JIRA expects "yyyy-MM-dd HH:mm")
-        since_str = since.strftime("%Y-%m-%d %H:%M")
-        date_filter = f'updated >= "{since_str}"'
+        total = getattr(page, 'total', None)
+        if limit and total is not None:
+            total = min(total, limit)
         
-        if exclude_done:
-            jql = f"{project_filter} AND {date_filter} AND status NOT IN (Done, Resolved, Closed) ORDER BY updated DESC"
-        else:
-            jql = f"{project_filter} AND {date_filter} ORDER BY updated DESC"
+        if not parallel or total is None:
+            start_at = len(page)
+            while page and (start_at < total if total is not None else len(page) >= batch_size):
+                if limit and start_at >= limit:
+                    return
+                logger.debug(f"Fetching tickets starting at {start_at}")
+                page = search(startAt=start_at)
+                yield page
+                start_at += len(page)
+            return
         
-        logger.info(f"Fetching tickets updated since {since_str} with JQL: {jql}")
+        stride = len(page)
+        offsets = range(stride, total, stride) if stride else range(0)
+        if not offsets:
+            return
         
+        logger.debug(f"Fetching {len(offsets)} more pages with {max_workers} workers")
+        executor = ThreadPoolExecutor(max_workers=max_workers)
         try:
-            all_tickets = []
-            start_at = 0
-            batch_size = 50
+            yield from executor.map(
+                lambda offset: self._fetch_page(search, offset, min(offset + stride, total)),
+                offsets
+            )
+        finally:
+            # Don't wait on pages nobody will read if the caller stops early
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def _fetch_page(search: Callable, start_at: int, end: int) -> List:
+        """
+        Fetch the issues from start_at up to end, topping up short pages.
+        
+        Args:
+            search: search_issues bound to the query, taking startAt
+            start_at: Index of the first issue
+            end: Index one past the last issue
             
-            while True:
-                # Fetch a batch of issues
-                logger.debug(f"Fetching updated tickets starting at {start_at}")
-                issues = self.client.search_issues(
-                    jql,
-                    startAt=start_at,
-                    maxResults=batch_size,
-                    expand='changelog'
-                )
-                
-                # Process this batch
-                for issue in issues:
-                    ticket_data = self._extract_ticket_data(issue)
-                    all_tickets.append(ticket_data)
-                
-                # Check if we have more pages
-                if len(issues) < batch_size:
-                    break  # No more pages
-                
-                start_at += batch_size
-                logger.info(f"Fetched {len(all_tickets)} updated tickets so far...")
+        Returns:
+            List of issues
+        """
+        issues = list(search(startAt=start_at))
+        while issues and start_at + len(issues) < end:
+            more = search(startAt=start_at + len(issues))
+            if not more:
+                break
+            issues.extend(more[:end - start_at - len(issues)])
+        return issues
+    
+    def get_updated_tickets(
+        self,
+        since: datetime,
+        *,
+        exclude_done: bool = True,
+        fields: Optional[str] = None,
+        expand: Optional[str] = None,
+        should_extract: Optional[Callable[[str, str], bool]] = None
+    ) -> List[Dict]:
+        """
+        Fetch tickets updated since a specific time.
+        
+        Args:
+            since: Datetime to fetch tickets updated after
+            exclude_done: If True, exclude tickets with Done status (default: True)
+            fields: Comma-separated fields to request (default: TICKET_FIELDS)
+            expand: Optional JIRA expand parameter (e.g. "changelog")
+            should_extract: Optional predicate taking (key, updated); issues it
+                rejects are skipped before their fields are extracted
             
-            logger.info(f"Found {len(all_tickets)} tickets updated since {since_str}")
-            return all_tickets
+        Returns:
+            List of ticket dictionaries updated since the given time
+        """
+        return list(self.iter_updated_tickets(
+            since,
+            exclude_done=exclude_done,
+            fields=fields,
+            expand=expand,
+            should_extract=should_extract
+        ))
+    
+    def iter_updated_tickets(
+        self,
+        since: datetime,
+        *,
+        exclude_done: bool = True,
+        fields: Optional[str] = None,
+        expand: Optional[str] = None,
+        should_extract: Optional[Callable[[str, str], bool]] = None
+    ) -> Iterator[Dict]:
+        """
+        Iterate over tickets updated since a specific time, page by page.
+        
+        Args:
+            since: Datetime to fetch tickets updated after
+            exclude_done: If True, exclude tickets with Done status (default: True)
+            fields: Comma-separated fields to request (default: TICKET_FIELDS)
+            expand: Optional JIRA expand parameter (e.g. "changelog")
+            should_extract: Optional predicate taking (key, updated); issues it
+                rejects are skipped before their fields are extracted
             
-        except JIRAError as e:
-            logger.error(f"Error fetching updated JIRA tickets: {e}")
-            raise
+        Yields:
+            Ticket dictionaries, most recently updated first
+        """
+        yield from self.iter_all_tickets(
+            order_by="updated DESC",
+            exclude_done=exclude_done,
+            fields=fields,
+            expand=expand,
+            should_extract=should_extract,
+            since=since
+        )
+    
+    def _extract_ticket_header(self, issue) -> Tuple[str, str]:
+        """Extract just the key and updated timestamp from a JIRA issue."""
+        return issue.key, issue.fields.updated
     
     def _extract_ticket_data(self, issue) -> Dict:
         """Extract relevant data from a JIRA issue."""
@@ -240,45 +502,20 @@ class JiraClient:
         
         data = {
             'key': issue.key,
-            'project': issue.fields.project.key,
-            'title': fields.summary,
-            'description': fields.description or '',
-            'assignee': fields.assignee.displayName if fields.assignee else 'Unassigned',
-            'assignee_email': getattr(fields.assignee, 'emailAddress', None) if fields.assignee else None,
-            'reporter': fields.reporter.displayName if fields.reporter else 'Unknown',
-            'reporter_email': getattr(fields.reporter, 'emailAddress', None) if fields.reporter else None,
-            'priority': fields.priority.name if fields.priority else 'None',
-            'status': fields.status.name,
-            'created': fields.created,
-            'updated': fields.updated,
+            'project': fields.project.key,
         }
-        
-        # Due date
-        if hasattr(fields, 'duedate') and fields.duedate:
-            data['due_date'] = fields.duedate
-        else:
-            data['due_date'] = None
-        
-        # Story points (custom field - may vary by instance)
-        story_points_field = getattr(fields, 'customfield_10016', None)
-        data['story_points'] = story_points_field if story_points_field else None
+        for name, accessor in self._FIELD_ACCESSORS:
+            data[name] = accessor(fields)
         
         # Sprint information
         sprint_field = getattr(fields, 'customfield_10020', None)
         if sprint_field and len(sprint_field) > 0:
-            # Parse sprint info from the string representation
             sprint_info = sprint_field[0]
-            if hasattr(sprint_info, 'name'):
-                data['sprint'] = sprint_info.name
-            else:
-                # Try to extract sprint name from string
-                sprint_str = str(sprint_info)
-                if 'name=' in sprint_str:
-                    start = sprint_str.find('name=') + 5
-                    end = sprint_str.find(',', start)
-                    data['sprint'] = sprint_str[start:end] if end > start else None
-                else:
-                    data['sprint'] = None
+            data['sprint'] = getattr(sprint_info, 'name', None)
+            if data['sprint'] is None:
+                # Older servers return the sprint as a string representation
+                match = _SPRINT_NAME_RE.search(str(sprint_info))
+                data['sprint'] = match.group(1) if match else None
         else:
             data['sprint'] = None
         
@@ -288,11 +525,19 @@ class JiraClient:
         return data
     
     def _get_comments(self, issue) -> List[Dict]:
-        """Get comments for an issue."""
+        """Get comments for an issue, using the ones embedded in the search result when complete."""
         comments = []
         
         try:
-            for comment in self.client.comments(issue):
+            comment_field = getattr(issue.fields, 'comment', None)
+            issue_comments = getattr(comment_field, 'comments', None)
+            total = getattr(comment_field, 'total', None)
+            
+            # Only go back to the server if the field is missing or truncated
+            if issue_comments is None or (total is not None and total > len(issue_comments)):
+                issue_comments = self.client.comments(issue)
+            
+            for comment in issue_comments:
                 comments.append({
                     'author': comment.author.displayName,
                     'created': comment.created,
@@ -2,46 +2,88 @@
 Obsidian client for managing notes via REST API
 """
 
-import json
 import logging
-from typing import Dict, List, Optional
+import re
+import threading
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Optional
 from urllib.parse import quote
 
 import requests
 from requests.exceptions import ConnectionError, RequestException
 
-from .config import ObsidianConfig
+from . import jsonutil
+from .config import ConfigError, ObsidianConfig
+from .httputil import build_adapter
 
 logger = logging.getLogger(__name__)
 
+# Ticket key at the start of a note name, e.g. "PROJ-123 Title.md"
+_TICKET_KEY_RE = re.compile(r'^([A-Z][A-Z0-9_]*-\d+) ')
+
+# Note bodies are sent raw, overriding the session's JSON Content-Type
+_MARKDOWN_HEADERS = {'Content-Type': 'text/markdown'}
+
+
+class PutResult(NamedTuple):
+    """Outcome of writing a note."""
+    
+    success: bool
+    etag: Optional[str] = None
+    # The write was refused because the note changed since the given ETag
+    conflict: bool = False
+
 
 class ObsidianClient:
     """Client for interacting with Obsidian via REST API."""
     
     def __init__(self, config: ObsidianConfig):
         """Initialize Obsidian client with configuration."""
+        errors = config.validate()
+        if errors:
+            raise ConfigError(errors)
+        
         self.config = config
         self.headers = {
             'Authorization': f'Bearer {config.api_key}',
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
+        
+        # Reuse one pooled, keep-alive, retrying session for every request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = build_adapter(config.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Lazily built mapping of ticket key -> note path in the configured folder
+        self._notes_index: Optional[Dict[str, str]] = None
+        self._index_lock = threading.Lock()
+    
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+    
+    def __enter__(self) -> "ObsidianClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def test_connection(self) -> Dict[str, any]:
         """Test Obsidian connection and return status information."""
         try:
             # Test with a simple request to list files in root
-            response = requests.get(
+            response = self.session.get(
                 f"{self.config.api_url}/vault/",
-                headers=self.headers,
                 timeout=5
             )
             
             if response.status_code == 200:
                 # Try to check if our folder exists
-                folder_response = requests.get(
+                folder_response = self.session.get(
                     f"{self.config.api_url}/vault/{quote(self.config.folder)}/",
-                    headers=self.headers,
                     timeout=5
                 )
                 
@@ -80,12 +122,12 @@ class ObsidianClient:
     
     def note_exists(self, note_path: str) -> bool:
         """Check if a note exists at the given path."""
+        url = f"{self.config.api_url}/vault/{quote(note_path)}"
         try:
-            response = requests.get(
-                f"{self.config.api_url}/vault/{quote(note_path)}",
-                headers=self.headers,
-                timeout=5
-            )
+            # HEAD avoids downloading the note body just to read the status
+            response = self.session.head(url, timeout=5, allow_redirects=False)
+            if response.status_code == 405:
+                response = self.session.get(url, timeout=5)
             return response.status_code == 200
         except RequestException:
             return False
@@ -96,9 +138,8 @@ class ObsidianClient:
         
         try:
             # Check if folder exists by listing its contents
-            response = requests.get(
+            response = self.session.get(
                 f"{self.config.api_url}/vault/{quote(folder_path)}/",
-                headers=self.headers,
                 timeout=5
             )
             
@@ -107,12 +148,9 @@ class ObsidianClient:
                 readme_path = f"{folder_path}/README.md"
                 content = f"# {folder_path}\n\nThis folder contains synchronized JIRA tickets."
                 
-                response = requests.put(
+                response = self.session.put(
                     f"{self.config.api_url}/vault/{quote(readme_path)}",
-                    headers={
-                        'Authorization': f'Bearer {self.config.api_key}',
-                        'Content-Type': 'text/markdown'
-                    },
+                    headers=_MARKDOWN_HEADERS,
                     data=content.encode('utf-8'),
                     timeout=10
                 )
@@ -127,38 +165,58 @@ class ObsidianClient:
     
     def save_note(self, note_path: str, content: str) -> bool:
         """Save or update a note at the given path."""
+        return self.put_note(note_path, content).success
+    
+    def put_note(self, note_path: str, content: str, etag: Optional[str] = None) -> PutResult:
+        """
+        Save or update a note, only if it is unchanged since the given ETag.
+        
+        Args:
+            note_path: Path of the note in the vault
+            content: Markdown content to write
+            etag: ETag from the last write; the note is left alone if it has
+                changed in Obsidian since (None = write unconditionally)
+            
+        Returns:
+            PutResult with the ETag of the written note if the server sent
+            one, or with conflict set if the note had changed
+        """
+        headers = _MARKDOWN_HEADERS
+        if etag:
+            headers = {**_MARKDOWN_HEADERS, 'If-Match': etag}
+        
         try:
             # The API expects the content as the request body, not JSON
-            response = requests.put(
+            response = self.session.put(
                 f"{self.config.api_url}/vault/{quote(note_path)}",
-                headers={
-                    'Authorization': f'Bearer {self.config.api_key}',
-                    'Content-Type': 'text/markdown'
-                },
+                headers=headers,
                 data=content.encode('utf-8'),
                 timeout=10
             )
             
             if response.status_code in [200, 201, 204]:
                 logger.info(f"Successfully saved note: {note_path}")
-                return True
+                self._index_add(note_path)
+                return PutResult(True, response.headers.get('ETag'))
+            elif response.status_code == 412:
+                logger.warning(f"Note changed in Obsidian since last sync, not overwriting: {note_path}")
+                return PutResult(False, conflict=True)
             else:
                 logger.error(
                     f"Failed to save note {note_path}: "
                     f"{response.status_code} - {response.text}"
                 )
-                return False
+                return PutResult(False)
                 
         except RequestException as e:
             logger.error(f"Error saving note {note_path}: {e}")
-            return False
+            return PutResult(False)
     
     def get_note_content(self, note_path: str) -> Optional[str]:
         """Get the content of a note."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.config.api_url}/vault/{quote(note_path)}",
-                headers=self.headers,
                 timeout=5
             )
             
@@ -175,14 +233,14 @@ class ObsidianClient:
     def delete_note(self, note_path: str) -> bool:
         """Delete a note at the given path."""
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f"{self.config.api_url}/vault/{quote(note_path)}",
-                headers=self.headers,
                 timeout=5
             )
             
             if response.status_code in [200, 204]:
                 logger.info(f"Successfully deleted note: {note_path}")
+                self._index_remove(note_path)
                 return True
             else:
                 logger.error(
@@ -199,41 +257,88 @@ class ObsidianClient:
         """
         Find an existing note by ticket key prefix.
         
+        The folder is listed once and cached as an index; later lookups
+        are served from the index, which is kept up to date as notes are
+        saved and deleted through this client.
+        
         Args:
             ticket_key: The JIRA ticket key (e.g., "PROJ-123")
             
         Returns:
             Full path to the existing note, or None if not found
         """
-        notes = self.list_notes()
+        # Locked so concurrent first lookups share a single folder listing
+        with self._index_lock:
+            if self._notes_index is None:
+                self._notes_index = self._build_notes_index()
+            
+            return self._notes_index.get(ticket_key)
+    
+    def get_notes_index(self) -> Dict[str, str]:
+        """
+        Get a snapshot of the ticket key to note path index for the configured folder.
         
-        # Look for notes that start with the ticket key
-        for note in notes:
-            # Extract just the filename without path
-            filename = note['name']
-            # Check if filename starts with ticket key followed by space
-            if filename.startswith(f"{ticket_key} "):
-                return note['path']
+        Returns:
+            Dictionary mapping ticket keys to note paths
+        """
+        with self._index_lock:
+            if self._notes_index is None:
+                self._notes_index = self._build_notes_index()
+            
+            return dict(self._notes_index)
+    
+    def invalidate_notes_index(self):
+        """Drop the cached notes index so the next lookup lists the folder again."""
+        with self._index_lock:
+            self._notes_index = None
+    
+    def _build_notes_index(self) -> Dict[str, str]:
+        """Build a mapping of ticket key to note path from the folder listing."""
+        index = {}
+        
+        for note in self.list_notes():
+            match = _TICKET_KEY_RE.match(note['name'])
+            if match:
+                index.setdefault(match.group(1), note['path'])
+        
+        return index
+    
+    def _index_add(self, note_path: str):
+        """Record a saved note in the notes index, if it has been built."""
+        folder, _, filename = note_path.rpartition('/')
+        match = _TICKET_KEY_RE.match(filename)
         
-        return None
+        with self._index_lock:
+            if self._notes_index is not None and folder == self.config.folder and match:
+                self._notes_index[match.group(1)] = note_path
     
-    def rename_note(self, old_path: str, new_path: str) -> bool:
+    def _index_remove(self, note_path: str):
+        """Remove a deleted note from the notes index, if it has been built."""
+        ticket_key = note_path.rpartition('/')[2].partition(' ')[0]
+        
+        with self._index_lock:
+            if self._notes_index is not None and self._notes_index.get(ticket_key) == note_path:
+                del self._notes_index[ticket_key]
+    
+    def rename_note(self, old_path: str, new_path: str, content: Optional[str] = None) -> bool:
         """
         Rename a note by creating it at new path and deleting old one.
         
         Args:
             old_path: Current path of the note
             new_path: New path for the note
+            content: Content to write at the new path (default: the old note's content)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # First, get the content of the old note
-            content = self.get_note_content(old_path)
+            # Read the old note only when the caller has no replacement content
             if content is None:
-                logger.error(f"Cannot read note to rename: {old_path}")
-                return False
+                content = self.get_note_content(old_path)
+                if content is None:
+                    logger.error(f"Cannot read note to rename: {old_path}")
+                    return False
             
             # Create the note at the new path
             if not self.save_note(new_path, content):
@@ -268,34 +373,30 @@ class ObsidianClient:
             folder_path = self.config.folder
             
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.config.api_url}/vault/{quote(folder_path)}/",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
                 # Parse the response - it should contain a list of files
-                data = response.json()
-                notes = []
+                data = jsonutil.loads(response.content)
+                prefix = f"{folder_path}/"
                 
-                # The API returns a files array
-                for item in data.get('files', []):
-                    # Only include markdown files
-                    if isinstance(item, str) and item.endswith('.md'):
-                        notes.append({
-                            'name': item,
-                            'path': f"{folder_path}/{item}"
-                        })
-                    elif isinstance(item, dict) and 'name' in item:
-                        # Handle different response format
-                        if item['name'].endswith('.md'):
-                            notes.append({
-                                'name': item['name'],
-                                'path': f"{folder_path}/{item['name']}"
-                            })
+                # The API returns a files array of names, or of objects with a name
+                names = (
+                    item.get('name') if isinstance(item, dict) else item
+                    for item in data.get('files', [])
+                )
                 
-                return sorted(notes, key=lambda x: x['name'])
+                # Only include markdown files, skipping entries without a string name
+                notes = [
+                    {'name': name, 'path': prefix + name}
+                    for name in names
+                    if isinstance(name, str) and name.endswith('.md')
+                ]
+                notes.sort(key=itemgetter('name'))
+                return notes
             elif response.status_code == 404:
                 logger.warning(f"Folder {folder_path} not found")
                 return []
@@ -303,6 +404,6 @@ class ObsidianClient:
                 logger.error(f"Failed to list notes in {folder_path}: {response.status_code}")
                 return []
                 
-        except RequestException as e:
+        except (RequestException, ValueError) as e:
             logger.error(f"Error listing notes in {folder_path}: {e}")
             return []
\ No newline at end of file
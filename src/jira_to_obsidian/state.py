@@ -2,18 +2,40 @@
 State persistence for JIRA to Obsidian sync
 """
 
-import json
 import logging
 import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
 from dateutil import parser
 
+from . import jsonutil
+
 logger = logging.getLogger(__name__)
 
 
+def _fsync_dir(path: Path):
+    """Flush a directory entry so a rename inside it survives a crash (POSIX only)."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a JIRA ISO-8601 timestamp, trying the C parser before dateutil."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.isoparse(value)
+
+
 class SyncState:
     """Manages sync state persistence for incremental updates."""
     
@@ -29,13 +51,17 @@ class SyncState:
             self.state_file = Path(state_file)
         
         self._state = self._load_state()
+        self._dirty = False
+        
+        # Parsed "updated" timestamps of stored tickets, filled on demand
+        self._parsed_stored: Dict[str, datetime] = {}
     
     def _load_state(self) -> Dict:
         """Load state from file or return empty state."""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    state = jsonutil.loads(f.read())
                 logger.debug(f"Loaded state from {self.state_file}")
                 return state
             except Exception as e:
@@ -54,14 +80,38 @@ class SyncState:
         }
     
     def save(self):
-        """Save current state to file."""
+        """Save current state to file if it has changed."""
+        if not self._dirty:
+            logger.debug("State unchanged, skipping save")
+            return
+        
+        tmp_path = None
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_file, 'w') as f:
-                json.dump(self._state, f, indent=2, default=str)
+            
+            # Write to a temporary file and swap it in so an interrupted
+            # save never leaves a truncated state file behind
+            with tempfile.NamedTemporaryFile(
+                dir=self.state_file.parent,
+                prefix=f".{self.state_file.name}.",
+                suffix=".tmp",
+                delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(jsonutil.dumps(self._state))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.state_file)
+            tmp_path = None
+            _fsync_dir(self.state_file.parent)
+            
+            self._dirty = False
             logger.debug(f"Saved state to {self.state_file}")
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
+        finally:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
     
     def get_last_sync_time(self) -> Optional[datetime]:
         """Get the last successful sync time."""
@@ -79,22 +129,39 @@ class SyncState:
         if sync_time is None:
             sync_time = datetime.utcnow()
         self._state["last_sync"] = sync_time.isoformat()
+        self._dirty = True
     
     def get_ticket_state(self, ticket_key: str) -> Optional[Dict]:
         """Get stored state for a ticket."""
         return self._state["tickets"].get(ticket_key)
     
-    def update_ticket_state(self, ticket_key: str, updated: str, file_path: str):
-        """Update state for a ticket."""
-        self._state["tickets"][ticket_key] = {
+    def update_ticket_state(
+        self,
+        ticket_key: str,
+        updated: str,
+        file_path: str,
+        content_hash: Optional[str] = None,
+        etag: Optional[str] = None
+    ):
+        """Update state for a ticket, including its note's content hash and ETag if known."""
+        ticket_state = {
             "updated": updated,
             "file_path": file_path,
             "last_synced": datetime.utcnow().isoformat()
         }
+        if content_hash is not None:
+            ticket_state["content_hash"] = content_hash
+        if etag is not None:
+            ticket_state["etag"] = etag
+        self._state["tickets"][ticket_key] = ticket_state
+        self._parsed_stored.pop(ticket_key, None)
+        self._dirty = True
     
     def remove_ticket_state(self, ticket_key: str):
         """Remove a ticket from state (e.g., if deleted)."""
-        self._state["tickets"].pop(ticket_key, None)
+        self._parsed_stored.pop(ticket_key, None)
+        if self._state["tickets"].pop(ticket_key, None) is not None:
+            self._dirty = True
     
     def is_ticket_updated(self, ticket_key: str, updated: str) -> bool:
         """Check if a ticket has been updated since last sync."""
@@ -104,8 +171,11 @@ class SyncState:
         
         # Compare update times
         try:
-            stored_time = parser.parse(stored["updated"])
-            current_time = parser.parse(updated)
+            stored_time = self._parsed_stored.get(ticket_key)
+            if stored_time is None:
+                stored_time = _parse_timestamp(stored["updated"])
+                self._parsed_stored[ticket_key] = stored_time
+            current_time = _parse_timestamp(updated)
             return current_time > stored_time
         except Exception as e:
             logger.warning(f"Error comparing times for {ticket_key}: {e}")
@@ -118,4 +188,6 @@ class SyncState:
     def clear(self):
         """Clear all state (useful for --full sync)."""
         self._state = self._empty_state()
+        self._parsed_stored.clear()
+        self._dirty = True
         logger.info("Cleared sync state")
\ No newline at end of file
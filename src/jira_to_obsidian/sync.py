@@ -3,11 +3,14 @@ Main synchronization logic for JIRA to Obsidian
 """
 
 import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .config import Config
 from .formatter import TicketFormatter
@@ -18,6 +21,45 @@ from .state import SyncState
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Headers a real write would send, shown in dry run reports
+_DRY_RUN_HEADERS = {
+    "Authorization": "Bearer [REDACTED]",
+    "Content-Type": "text/markdown"
+}
+
+# Characters of note content shown in a dry run report
+_PREVIEW_LENGTH = 500
+
+
+@dataclass
+class DryRunAction:
+    """A note write that a dry run would have performed."""
+    
+    action: str
+    ticket: str
+    file_path: str
+    old_file_path: Optional[str]
+    api_endpoint: str
+    content: str = field(repr=False)
+    http_method: str = "PUT"
+    
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers the write would send."""
+        return _DRY_RUN_HEADERS
+    
+    @property
+    def content_length(self) -> int:
+        """Length of the note content."""
+        return len(self.content)
+    
+    @property
+    def content_preview(self) -> str:
+        """Start of the note content, truncated for display."""
+        if len(self.content) > _PREVIEW_LENGTH:
+            return self.content[:_PREVIEW_LENGTH] + "..."
+        return self.content
+
 
 class JiraObsidianSync:
     """Main synchronization class."""
@@ -29,21 +71,29 @@ class JiraObsidianSync:
         self.obsidian_client = ObsidianClient(config.obsidian)
         self.formatter = TicketFormatter(config.jira.server)
         self.state = SyncState()
+        
+        # Guards the shared results dict while tickets are processed concurrently
+        self._results_lock = threading.Lock()
     
     def test_connections(self) -> Dict[str, Dict]:
-        """Test both JIRA and Obsidian connections."""
-        return {
-            "jira": self.jira_client.test_connection(),
-            "obsidian": self.obsidian_client.test_connection()
-        }
+        """Test both JIRA and Obsidian connections concurrently."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            jira_future = executor.submit(self.jira_client.test_connection)
+            obsidian_future = executor.submit(self.obsidian_client.test_connection)
+            
+            return {
+                "jira": jira_future.result(),
+                "obsidian": obsidian_future.result()
+            }
     
-    def sync(self, dry_run: bool = False, full_sync: bool = False) -> Dict[str, any]:
+    def sync(self, dry_run: bool = False, full_sync: bool = False, force: bool = False) -> Dict[str, any]:
         """
         Perform the synchronization.
         
         Args:
             dry_run: If True, show what would be done without actually doing it
             full_sync: If True, perform a full sync ignoring state
+            force: If True, rewrite notes even when their ticket is unchanged
             
         Returns:
             Dictionary with sync results
@@ -53,7 +103,10 @@ class JiraObsidianSync:
             "tickets_found": 0,
             "notes_created": 0,
             "notes_updated": 0,
+            "notes_skipped": 0,
             "errors": [],
+            # Notes edited in Obsidian since the last sync, left as they are
+            "conflicts": [],
             "dry_run": dry_run,
             "dry_run_actions": []
         }
@@ -63,23 +116,13 @@ class JiraObsidianSync:
             if not dry_run:
                 self.obsidian_client.create_folder_if_needed()
             
-            # Get all non-done tickets
             # Determine which tickets to fetch based on sync mode
             if full_sync:
-                # Clear state for full sync
-                self.state.clear()
+                # Clear state for full sync (a dry run must leave it intact)
+                if not dry_run:
+                    self.state.clear()
                 logger.info("Performing full sync - fetching all non-done tickets from JIRA...")
-                
-                # Use progress indicator for fetching
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                    transient=True
-                ) as progress:
-                    task = progress.add_task("Fetching all tickets from JIRA...", total=None)
-                    tickets = self.jira_client.get_all_tickets(exclude_done=True)
-                    progress.update(task, completed=100)
+                last_sync = None
             else:
                 # Incremental sync - only fetch updated tickets
                 last_sync = self.state.get_last_sync_time()
@@ -87,81 +130,69 @@ class JiraObsidianSync:
                 if last_sync is None:
                     # First sync ever - do a full sync
                     logger.info("No previous sync found - performing initial full sync...")
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        console=console,
-                        transient=True
-                    ) as progress:
-                        task = progress.add_task("Fetching all tickets from JIRA...", total=None)
-                        tickets = self.jira_client.get_all_tickets(exclude_done=True)
-                        progress.update(task, completed=100)
                 else:
-                    # Fetch only updated tickets
                     logger.info(f"Fetching tickets updated since {last_sync.strftime('%Y-%m-%d %H:%M')}...")
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        console=console,
-                        transient=True
-                    ) as progress:
-                        task = progress.add_task("Fetching updated tickets from JIRA...", total=None)
-                        tickets = self.jira_client.get_updated_tickets(since=last_sync, exclude_done=True)
-                        progress.update(task, completed=100)
             
-            results["tickets_found"] = len(tickets)
+            tickets = self._iter_tickets(since=last_sync, force=force)
             
-            if not tickets:
-                logger.info("No active tickets found")
-                results["success"] = True
-                return results
+            # List the folder once up front rather than looking up each ticket
+            existing_index = None if dry_run else self.obsidian_client.get_notes_index()
+            
+            # Process tickets as JIRA pages arrive; each one is bound by
+            # Obsidian API round-trips, so they run concurrently
+            fetch_order: Dict[str, int] = {}
+            max_workers = self.config.obsidian.max_workers
             
-            # Process each ticket with progress bar
             with Progress(
+                SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
                 console=console,
                 transient=True
             ) as progress:
-                task = progress.add_task(
-                    f"Processing {len(tickets)} tickets...", 
-                    total=len(tickets)
-                )
+                task = progress.add_task("Fetching tickets from JIRA...", total=None)
                 
-                for ticket in tickets:
-                    try:
-                        self._process_ticket(ticket, results, dry_run)
-                        progress.update(task, advance=1)
-                    except Exception as e:
-                        error_msg = f"Error processing ticket {ticket['key']}: {str(e)}"
-                        logger.error(error_msg)
-                        results["errors"].append(error_msg)
-                        progress.update(task, advance=1)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    pending: Dict[Future, Dict] = {}
+                    
+                    for ticket in tickets:
+                        # Pages fetched concurrently can overlap if JIRA reorders meanwhile
+                        if ticket['key'] in fetch_order:
+                            continue
+                        fetch_order[ticket['key']] = len(fetch_order)
+                        results["tickets_found"] += 1
+                        
+                        future = executor.submit(self._process_ticket, ticket, results, dry_run, existing_index, force)
+                        pending[future] = ticket
+                        
+                        # Keep the backlog bounded so memory follows the pool size, not the result set
+                        if len(pending) >= 2 * max_workers:
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            self._collect_processed(done, pending, results)
+                        
+                        progress.update(
+                            task,
+                            description=f"Processing tickets... {results['tickets_found'] - len(pending)} of {results['tickets_found']} done"
+                        )
+                    
+                    self._collect_processed(list(pending), pending, results)
+            
+            if not results["tickets_found"]:
+                logger.info("No active tickets found")
+            
+            # Keep the dry run report in fetch order
+            if dry_run:
+                results["dry_run_actions"].sort(key=lambda action: fetch_order[action.ticket])
             
             results["success"] = len(results["errors"]) == 0
             
-            # During incremental sync, check for tickets that may have moved to Done
-            if not full_sync and not dry_run and results["success"]:
-                # Get all currently tracked tickets
-                tracked_tickets = self.state.get_all_tracked_tickets()
-                processed_keys = {ticket['key'] for ticket in tickets}
-                
-                # Find tickets that were not in the update but are still tracked
-                potentially_done_keys = set(tracked_tickets.keys()) - processed_keys
-                
-                if potentially_done_keys:
-                    logger.info(f"Checking {len(potentially_done_keys)} tickets that may have moved to Done status...")
-                    
-                    # We could optionally check these tickets individually or just note them
-                    # For now, we'll keep them in state but log them
-                    for key in potentially_done_keys:
-                        logger.debug(f"Ticket {key} was not in recent updates - may be Done or unchanged")
+            # During incremental sync, stop tracking tickets that moved to Done;
+            # they are excluded from the fetch above, so ask JIRA for them directly
+            if last_sync is not None and not dry_run and results["success"]:
+                self._untrack_done_tickets(since=last_sync)
             
-            # Update sync state if successful and not in dry run mode
+            # Only a successful sync moves the last sync time forward
             if results["success"] and not dry_run:
                 self.state.set_last_sync_time()
-                self.state.save()
                 logger.info("Updated sync state")
             
         except Exception as e:
@@ -169,97 +200,224 @@ class JiraObsidianSync:
             logger.error(error_msg)
             results["errors"].append(error_msg)
         
+        finally:
+            # Keep the notes written by a failed incremental sync tracked, but
+            # don't replace the state on disk with one a failed full sync cleared
+            if not dry_run and (results["success"] or not full_sync):
+                self.state.save()
+        
         return results
     
-    def _process_ticket(self, ticket: Dict, results: Dict, dry_run: bool = False):
-        """Process a single ticket."""
-        # Format the note
-        note_title, note_content = self.formatter.format_note(ticket)
-        note_path = f"{self.config.obsidian.folder}/{note_title}.md"
+    def _iter_tickets(self, since: Optional[datetime] = None, force: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over non-done tickets from JIRA as pages arrive.
         
-        # Look for existing note by ticket key
-        existing_note_path = None
-        if not dry_run:
-            existing_note_path = self.obsidian_client.find_note_by_ticket_key(ticket['key'])
+        Args:
+            since: Only fetch tickets updated since this time (None = all tickets)
+            force: If True, don't skip tickets that are unchanged in state
+            
+        Returns:
+            Iterator of ticket dictionaries
+        """
+        if since is None:
+            return self.jira_client.iter_all_tickets(exclude_done=True)
+        
+        return self.jira_client.iter_updated_tickets(
+            since=since,
+            exclude_done=True,
+            should_extract=None if force else self.state.is_ticket_updated
+        )
+    
+    def _collect_processed(self, done: Iterable[Future], pending: Dict[Future, Dict], results: Dict):
+        """Wait for finished ticket jobs, record any errors and drop them from pending."""
+        for future in done:
+            ticket = pending.pop(future)
+            try:
+                future.result()
+            except Exception as e:
+                error_msg = f"Error processing ticket {ticket['key']}: {str(e)}"
+                logger.error(error_msg)
+                with self._results_lock:
+                    results["errors"].append(error_msg)
+    
+    def _untrack_done_tickets(self, since: datetime):
+        """Stop tracking tickets moved to a done status since the given time; their notes are kept."""
+        try:
+            done_keys = self.jira_client.get_done_ticket_keys(since)
+        except Exception as e:
+            # Not fatal - the tickets simply stay tracked until the next sync
+            logger.warning(f"Could not check for tickets moved to Done: {e}")
+            return
+        
+        for key in done_keys & self.state.get_all_tracked_tickets().keys():
+            logger.info(f"Ticket {key} moved to Done - no longer tracking it")
+            self.state.remove_ticket_state(key)
+    
+    def _process_ticket(self, ticket: Dict, results: Dict, dry_run: bool = False, existing_index: Optional[Dict[str, str]] = None, force: bool = False):
+        """Process a single ticket, using existing_index for note lookups when given."""
+        # Skip tickets unchanged since their note was written, unless the note is gone
+        previous = self.state.get_ticket_state(ticket['key'])
+        if (
+            not force
+            and not dry_run
+            and previous
+            and previous['updated'] == ticket['updated']
+            and (existing_index is None or ticket['key'] in existing_index)
+        ):
+            logger.debug(f"Skipping unchanged ticket: {ticket['key']}")
+            with self._results_lock:
+                results["notes_skipped"] += 1
+            return
         
-        # Determine if this is an update or create
-        exists = existing_note_path is not None
-        needs_rename = exists and existing_note_path != note_path
+        success, outcome = self._render_and_save(
+            ticket,
+            dry_run=dry_run,
+            existing_index=existing_index,
+            skip_existing=not self.config.obsidian.update_existing,
+            previous=None if force else previous
+        )
         
-        if exists and not self.config.obsidian.update_existing:
+        if outcome["skipped"]:
             logger.info(f"Skipping existing note: {ticket['key']}")
             return
         
+        exists = outcome["existing_path"] is not None
+        
         if dry_run:
             # In dry run mode, just record what would be done
             action = "UPDATE" if exists else "CREATE"
-            if needs_rename:
+            if outcome["renamed"]:
                 action = "UPDATE + RENAME"
             
-            dry_run_info = {
-                "action": action,
-                "ticket": ticket['key'],
-                "file_path": note_path,
-                "old_file_path": existing_note_path if needs_rename else None,
-                "api_endpoint": f"{self.config.obsidian.api_url}/vault/{note_path}",
-                "http_method": "PUT",
-                "headers": {
-                    "Authorization": "Bearer [REDACTED]",
-                    "Content-Type": "text/markdown"
-                },
-                "content_preview": note_content[:500] + "..." if len(note_content) > 500 else note_content,
-                "content_length": len(note_content)
-            }
-            
-            results["dry_run_actions"].append(dry_run_info)
+            dry_run_action = DryRunAction(
+                action=action,
+                ticket=ticket['key'],
+                file_path=outcome["path"],
+                old_file_path=outcome["existing_path"] if outcome["renamed"] else None,
+                api_endpoint=f"{self.config.obsidian.api_url}/vault/{outcome['path']}",
+                content=outcome["content"]
+            )
             
-            if exists:
-                results["notes_updated"] += 1
-                if needs_rename:
-                    logger.info(f"[DRY RUN] Would rename and update note: {existing_note_path} -> {note_path}")
-                else:
-                    logger.info(f"[DRY RUN] Would update note: {note_title}")
-            else:
-                results["notes_created"] += 1
-                logger.info(f"[DRY RUN] Would create note: {note_title}")
-        else:
-            # Handle the actual save/rename operations
-            success = False
+            with self._results_lock:
+                results["dry_run_actions"].append(dry_run_action)
+                results["notes_updated" if exists else "notes_created"] += 1
             
-            if needs_rename:
-                # First update the content at the existing path
-                if self.obsidian_client.save_note(existing_note_path, note_content):
-                    # Then rename to the new path
-                    success = self.obsidian_client.rename_note(existing_note_path, note_path)
-                    if success:
-                        logger.info(f"Renamed and updated note: {existing_note_path} -> {note_path}")
-                    else:
-                        error_msg = f"Failed to rename note from {existing_note_path} to {note_path}"
-                        results["errors"].append(error_msg)
-                else:
-                    error_msg = f"Failed to update note content before rename: {existing_note_path}"
-                    results["errors"].append(error_msg)
+            if outcome["renamed"]:
+                logger.info(f"[DRY RUN] Would rename and update note: {outcome['existing_path']} -> {outcome['path']}")
+            elif exists:
+                logger.info(f"[DRY RUN] Would update note: {outcome['title']}")
             else:
-                # Just save the note (create or update without rename)
-                success = self.obsidian_client.save_note(note_path, note_content)
-                
-            if success:
-                if exists:
-                    results["notes_updated"] += 1
-                    logger.info(f"Updated note: {note_title}")
+                logger.info(f"[DRY RUN] Would create note: {outcome['title']}")
+        elif success:
+            with self._results_lock:
+                if outcome["unchanged"]:
+                    results["notes_skipped"] += 1
                 else:
-                    results["notes_created"] += 1
-                    logger.info(f"Created note: {note_title}")
+                    results["notes_updated" if exists else "notes_created"] += 1
                 
                 # Update state with ticket info
                 self.state.update_ticket_state(
                     ticket['key'],
                     ticket['updated'],
-                    note_path
+                    outcome["path"],
+                    outcome["content_hash"],
+                    outcome["etag"]
                 )
-            elif not needs_rename:  # Don't double-log rename errors
-                error_msg = f"Failed to save note: {note_title}"
-                results["errors"].append(error_msg)
+        else:
+            with self._results_lock:
+                results["conflicts" if outcome["conflict"] else "errors"].append(outcome["error"])
+    
+    def _render_and_save(
+        self,
+        ticket: Dict,
+        dry_run: bool = False,
+        existing_index: Optional[Dict[str, str]] = None,
+        skip_existing: bool = False,
+        previous: Optional[Dict] = None
+    ) -> Tuple[bool, Dict]:
+        """
+        Format a ticket's note and write it to Obsidian, renaming the old note if the title changed.
+        
+        Args:
+            ticket: Ticket dictionary from JiraClient
+            dry_run: If True, only work out what would be written
+            existing_index: Map of ticket key to note path; looked up per ticket when None
+            skip_existing: If True, leave notes that already exist untouched
+            previous: Stored state for the ticket; the write is skipped when the
+                note is in place and its content hash still matches, otherwise
+                its ETag keeps a note edited in Obsidian from being overwritten
+            
+        Returns:
+            Tuple of (success, outcome) where outcome holds the note title, path,
+            content and its hash, existing path, ETag, whether it was renamed,
+            skipped, unchanged or refused as a conflict, and any error
+        """
+        note_title, note_content = self.formatter.format_note(ticket)
+        note_path = f"{self.config.obsidian.folder}/{note_title}.md"
+        
+        # Look for existing note by ticket key
+        existing_note_path = None
+        if existing_index is not None:
+            existing_note_path = existing_index.get(ticket['key'])
+        elif not dry_run:
+            existing_note_path = self.obsidian_client.find_note_by_ticket_key(ticket['key'])
+        
+        content_hash = self.formatter.content_hash(note_content)
+        
+        outcome = {
+            "title": note_title,
+            "path": note_path,
+            "content": note_content,
+            "content_hash": content_hash,
+            "existing_path": existing_note_path,
+            "renamed": existing_note_path is not None and existing_note_path != note_path,
+            "skipped": existing_note_path is not None and skip_existing,
+            "unchanged": False,
+            "conflict": False,
+            "etag": None,
+            "error": None
+        }
+        
+        if outcome["skipped"] or dry_run:
+            return False, outcome
+        
+        # Field changes that don't show up in the note leave nothing to write
+        if (
+            previous
+            and previous.get('content_hash') == content_hash
+            and existing_note_path == note_path
+        ):
+            logger.debug(f"Note unchanged, skipping write: {note_title}")
+            outcome["unchanged"] = True
+            outcome["etag"] = previous.get('etag')
+            return True, outcome
+        
+        if outcome["renamed"]:
+            # Write the new content straight to the new path and drop the old note
+            if self.obsidian_client.rename_note(existing_note_path, note_path, note_content):
+                logger.info(f"Renamed and updated note: {existing_note_path} -> {note_path}")
+                return True, outcome
+            outcome["error"] = f"Failed to rename note from {existing_note_path} to {note_path}"
+            return False, outcome
+        
+        # Only an ETag for the note at this same path can guard the write
+        etag = None
+        if previous and previous.get('file_path') == note_path:
+            etag = previous.get('etag')
+        
+        result = self.obsidian_client.put_note(note_path, note_content, etag)
+        outcome["etag"] = result.etag
+        if result.success:
+            logger.info(f"{'Updated' if existing_note_path else 'Created'} note: {note_title}")
+            return True, outcome
+        
+        if result.conflict:
+            outcome["conflict"] = True
+            outcome["error"] = f"{ticket['key']}: {note_path} was edited in Obsidian since the last sync"
+            return False, outcome
+        
+        outcome["error"] = f"Failed to save note: {note_title}"
+        return False, outcome
     
     def sync_single_ticket(self, ticket_key: str) -> Dict[str, any]:
         """Sync a single ticket by key."""
@@ -273,33 +431,24 @@ class JiraObsidianSync:
         
         try:
             # Fetch the specific ticket
-            jql = f'key = "{ticket_key}"'
-            issues = self.jira_client.client.search_issues(jql, maxResults=1)
+            ticket = self.jira_client.get_ticket(ticket_key)
             
-            if not issues:
+            if ticket is None:
                 results["error"] = f"Ticket {ticket_key} not found"
                 return results
             
             results["ticket_found"] = True
             
-            # Extract ticket data
-            ticket = self.jira_client._extract_ticket_data(issues[0])
-            
-            # Process the ticket
-            note_title, note_content = self.formatter.format_note(ticket)
-            note_path = f"{self.config.obsidian.folder}/{note_title}.md"
-            
-            exists = self.obsidian_client.note_exists(note_path)
-            success = self.obsidian_client.save_note(note_path, note_content)
+            success, outcome = self._render_and_save(ticket)
             
             if success:
                 results["success"] = True
-                if exists:
+                if outcome["existing_path"] is not None:
                     results["note_updated"] = True
                 else:
                     results["note_created"] = True
             else:
-                results["error"] = "Failed to save note to Obsidian"
+                results["error"] = outcome["error"]
                 
         except Exception as e:
             results["error"] = str(e)
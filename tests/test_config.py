@@ -5,7 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
-from jira_to_obsidian.config import Config, JiraConfig, ObsidianConfig
+from jira_to_obsidian.config import Config, ConfigError, JiraConfig, ObsidianConfig
 
 
 class TestJiraConfig:
@@ -27,6 +27,7 @@ class TestJiraConfig:
         assert config.email == "test@example.com"
         assert config.api_token == "test-token"
         assert config.projects == ["PROJ1", "PROJ2", "PROJ3"]
+        assert config.max_workers == 5
     
     def test_from_env_strips_trailing_slash(self):
         """Test that trailing slash is stripped from server URL."""
@@ -57,6 +58,14 @@ class TestJiraConfig:
         assert "JIRA_EMAIL is required" in errors
         assert "JIRA_API_TOKEN is required" in errors
         assert "JIRA_PROJECTS is required (comma-separated list)" in errors
+    
+    def test_from_env_max_workers(self):
+        """Test reading and validating the JIRA page fetch concurrency."""
+        with patch.dict(os.environ, {"JIRA_MAX_WORKERS": "0"}):
+            config = JiraConfig.from_env()
+        
+        assert config.max_workers == 0
+        assert "JIRA_MAX_WORKERS must be at least 1" in config.validate()
 
 
 class TestObsidianConfig:
@@ -75,6 +84,7 @@ class TestObsidianConfig:
         assert config.api_key == "test-key"
         assert config.folder == "JIRA"
         assert config.update_existing is True
+        assert config.max_workers == 8
     
     def test_from_env_with_custom_values(self):
         """Test creating ObsidianConfig with custom values."""
@@ -82,7 +92,8 @@ class TestObsidianConfig:
             "OBSIDIAN_API_URL": "http://custom:8080/",
             "OBSIDIAN_API_KEY": "test-key",
             "OBSIDIAN_FOLDER": "Tickets",
-            "UPDATE_EXISTING_NOTES": "false"
+            "UPDATE_EXISTING_NOTES": "false",
+            "OBSIDIAN_MAX_WORKERS": "4"
         }
         
         with patch.dict(os.environ, env_vars):
@@ -91,6 +102,7 @@ class TestObsidianConfig:
         assert config.api_url == "http://custom:8080"
         assert config.folder == "Tickets"
         assert config.update_existing is False
+        assert config.max_workers == 4
     
     def test_validate_with_valid_config(self):
         """Test validation with valid configuration."""
@@ -121,9 +133,9 @@ class TestObsidianConfig:
 class TestConfig:
     """Test Config class."""
     
-    def test_from_env_loads_dotenv(self):
-        """Test that from_env loads .env file."""
-        with patch('jira_to_obsidian.config.load_dotenv') as mock_load:
+    def test_from_env_does_not_load_dotenv(self):
+        """Test that from_env reads the environment without re-parsing .env."""
+        with patch('dotenv.load_dotenv') as mock_load:
             with patch.dict(os.environ, {
                 "JIRA_SERVER": "https://test.atlassian.net",
                 "JIRA_EMAIL": "test@example.com",
@@ -131,9 +143,10 @@ class TestConfig:
                 "JIRA_PROJECTS": "PROJ1",
                 "OBSIDIAN_API_KEY": "key"
             }):
-                Config.from_env()
+                config = Config.from_env()
                 
-        mock_load.assert_called_once()
+        mock_load.assert_not_called()
+        assert config.jira.server == "https://test.atlassian.net"
     
     def test_validate_combines_errors(self):
         """Test that validate combines errors from all configs."""
@@ -171,4 +184,51 @@ class TestConfig:
         
         errors = config.validate()
         assert len(errors) == 1
-        assert "SYNC_INTERVAL_MINUTES must be at least 1" in errors
\ No newline at end of file
+        assert "SYNC_INTERVAL_MINUTES must be at least 1" in errors
+    
+    def test_load_caches_config(self):
+        """Test that load only reads the environment once."""
+        Config.load.cache_clear()
+        try:
+            with patch.object(Config, 'from_env', wraps=Config.from_env) as mock_from_env:
+                first = Config.load()
+                second = Config.load()
+        finally:
+            Config.load.cache_clear()
+        
+        assert first is second
+        mock_from_env.assert_called_once()
+    
+    def test_jira_only_skips_obsidian(self):
+        """Test that jira_only loads just the JIRA settings."""
+        with patch.dict(os.environ, {
+            "JIRA_SERVER": "https://test.atlassian.net",
+            "JIRA_EMAIL": "test@example.com",
+            "JIRA_API_TOKEN": "token",
+            "JIRA_PROJECTS": "PROJ1"
+        }, clear=True):
+            config = Config.jira_only()
+        
+        assert config.obsidian is None
+        assert config.validate_jira() == []
+        assert config.validate_obsidian() == ["Obsidian configuration was not loaded"]
+    
+    def test_obsidian_only_skips_jira(self):
+        """Test that obsidian_only loads just the Obsidian settings."""
+        with patch.dict(os.environ, {"OBSIDIAN_API_KEY": "key"}, clear=True):
+            config = Config.obsidian_only()
+        
+        assert config.jira is None
+        assert config.validate_obsidian() == []
+        assert config.validate_jira() == ["JIRA configuration was not loaded"]
+
+
+class TestConfigError:
+    """Test ConfigError class."""
+    
+    def test_keeps_error_list(self):
+        """Test that ConfigError exposes the individual errors."""
+        error = ConfigError(["JIRA_SERVER is required", "JIRA_EMAIL is required"])
+        
+        assert error.errors == ["JIRA_SERVER is required", "JIRA_EMAIL is required"]
+        assert str(error) == "JIRA_SERVER is required; JIRA_EMAIL is required"
@@ -4,7 +4,7 @@ from datetime import datetime
 
 import pytest
 
-from jira_to_obsidian.formatter import TicketFormatter
+from jira_to_obsidian.formatter import TicketFormatter, _jira_to_markdown
 
 
 class TestTicketFormatter:
@@ -68,6 +68,16 @@ class TestTicketFormatter:
         title = formatter._format_title(ticket)
         assert title == "PROJ-456 Fix bug with spaces"
     
+    @pytest.mark.parametrize("raw, expected", [
+        ('Say "hello"', "Say 'hello'"),
+        ("a*b|c\\d", "a-b-c-d"),
+        ("tabs\t\tand  spaces ", "tabs and spaces"),
+    ])
+    def test_format_title_translation_table(self, formatter, sample_ticket, raw, expected):
+        """Test the remaining characters handled by the title translation table."""
+        sample_ticket['title'] = raw
+        assert formatter._format_title(sample_ticket) == f"PROJ-123 {expected}"
+    
     def test_format_note_structure(self, formatter, sample_ticket):
         """Test that format_note returns correct structure."""
         title, content = formatter.format_note(sample_ticket)
@@ -156,6 +166,15 @@ class TestTicketFormatter:
         footer = formatter._format_footer(sample_ticket)
         assert footer == "---\n[View in JIRA](https://test.atlassian.net/browse/PROJ-123)"
     
+    def test_content_hash_ignores_updated_time(self, formatter, sample_ticket):
+        """Test that only changes visible beyond the updated time change the hash."""
+        _, content = formatter.format_note(sample_ticket)
+        _, touched = formatter.format_note(dict(sample_ticket, updated="2024-02-01T09:00:00+00:00"))
+        _, edited = formatter.format_note(dict(sample_ticket, status="Done"))
+        
+        assert formatter.content_hash(touched) == formatter.content_hash(content)
+        assert formatter.content_hash(edited) != formatter.content_hash(content)
+    
     def test_convert_jira_to_markdown(self, formatter):
         """Test JIRA wiki to Markdown conversion."""
         jira_text = """h1. Header 1
@@ -183,9 +202,38 @@ some code
         assert "1. Numbered item" in result
         assert "```" in result
     
-    def test_format_date(self, formatter):
+    @pytest.mark.parametrize("jira_text, expected", [
+        ("** Nested item", "  - Nested item"),
+        ("## Nested step", "   1. Nested step"),
+        ("h3.   Spaced header", "### Spaced header"),
+        ("{code:java}\nint x;\n{code}", "```java\nint x;\n```"),
+        ("{code:java|title=Foo.java}\nint x;\n{code}", "```java\nint x;\n```"),
+        ("{code:title=Foo.java}\nint x;\n{code}", "```\nint x;\n```"),
+        ("{noformat}raw{noformat}", "```raw```"),
+        ("call some_function_name on 2024-01-01", "call some_function_name on 2024-01-01"),
+        ("a * b * c", "a * b * c"),
+    ])
+    def test_convert_jira_to_markdown_edge_cases(self, formatter, jira_text, expected):
+        """Test that conversions respect nesting, languages and word boundaries."""
+        assert formatter._convert_jira_to_markdown(jira_text) == expected
+    
+    def test_convert_jira_to_markdown_cached(self, formatter):
+        """Test that repeated comment bodies are converted once."""
+        _jira_to_markdown.cache_clear()
+        
+        for _ in range(3):
+            assert formatter._convert_jira_to_markdown("*same* comment") == "**same** comment"
+        
+        assert _jira_to_markdown.cache_info().hits == 2
+    
+    @pytest.mark.parametrize("date_str", [
+        "2024-01-01T15:30:45+00:00",
+        "2024-01-01T15:30:45.123+0000",
+        "2024-01-01 15:30:45",
+        "Mon, 01 Jan 2024 15:30:45",
+    ])
+    def test_format_date(self, formatter, date_str):
         """Test date formatting."""
-        date_str = "2024-01-01T15:30:45+00:00"
         formatted = formatter._format_date(date_str)
         assert formatted == "2024-01-01 15:30"
     
@@ -193,4 +241,9 @@ some code
         """Test formatting invalid date returns original."""
         invalid_date = "not-a-date"
         formatted = formatter._format_date(invalid_date)
-        assert formatted == "not-a-date"
\ No newline at end of file
+        assert formatted == "not-a-date"
+    
+    def test_format_empty_date(self, formatter):
+        """Test formatting a missing date returns an empty string."""
+        assert formatter._format_date("") == ""
+        assert formatter._format_date(None) == ""
\ No newline at end of file
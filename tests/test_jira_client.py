@@ -0,0 +1,314 @@
+"""Tests for JIRA client module."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from jira_to_obsidian.config import JiraConfig
+from jira_to_obsidian.jira_client import JiraClient
+
+
+def make_comment(author: str, body: str) -> SimpleNamespace:
+    """Create a comment object shaped like the jira library's."""
+    return SimpleNamespace(
+        author=SimpleNamespace(displayName=author),
+        created="2024-01-01T10:00:00.000+0000",
+        body=body
+    )
+
+
+def make_issue(**overrides) -> SimpleNamespace:
+    """Create an issue object shaped like the jira library's."""
+    fields = dict(
+        project=SimpleNamespace(key="PROJ"),
+        summary="Test ticket",
+        description=None,
+        assignee=SimpleNamespace(displayName="John Doe", emailAddress="john@example.com"),
+        reporter=None,
+        priority=SimpleNamespace(name="High"),
+        status=SimpleNamespace(name="In Progress"),
+        created="2024-01-01T10:00:00.000+0000",
+        updated="2024-01-02T15:30:00.000+0000",
+        duedate=None,
+        customfield_10016=5,
+        customfield_10020=None,
+        comment=SimpleNamespace(comments=[], total=0)
+    )
+    fields.update(overrides)
+    return SimpleNamespace(key="PROJ-1", fields=SimpleNamespace(**fields))
+
+
+class ResultPage(list):
+    """A page of search results carrying the total match count."""
+    total = 0
+
+
+class TestJiraClient:
+    """Test JiraClient class."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create client instance with a mocked JIRA connection."""
+        client = JiraClient(JiraConfig(
+            server="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="test-token",
+            projects=["PROJ"]
+        ))
+        client._client = Mock()
+        return client
+    
+    def test_client_skips_server_info_and_widens_pool(self, client):
+        """Test that the JIRA connection is created without a server info request."""
+        client._client = None
+        
+        with patch('jira_to_obsidian.jira_client.JIRA') as jira_class:
+            with patch('jira_to_obsidian.jira_client.build_adapter') as build:
+                jira = client.client
+        
+        assert jira_class.call_args.kwargs['get_server_info'] is False
+        build.assert_called_once_with(client.config.max_workers, retry=None)
+        assert jira._session.mount.call_args.args[1] is build.return_value
+    
+    def test_get_ticket_requests_ticket_fields(self, client):
+        """Test fetching a single ticket with the projected field list."""
+        client._client.search_issues.return_value = [make_issue()]
+        
+        ticket = client.get_ticket("PROJ-1")
+        
+        assert ticket['key'] == "PROJ-1"
+        client._client.search_issues.assert_called_once_with(
+            'key = "PROJ-1"', maxResults=1, fields=JiraClient.TICKET_FIELDS
+        )
+    
+    def test_get_ticket_not_found(self, client):
+        """Test fetching a ticket that does not exist."""
+        client._client.search_issues.return_value = []
+        
+        assert client.get_ticket("PROJ-404") is None
+    
+    def test_get_done_ticket_keys(self, client):
+        """Test that recently finished tickets come from one keys-only JQL search."""
+        page = ResultPage([SimpleNamespace(key="PROJ-1"), SimpleNamespace(key="PROJ-2")])
+        page.total = 2
+        client._client.search_issues.return_value = page
+        
+        keys = client.get_done_ticket_keys(datetime(2024, 1, 2, 3, 4))
+        
+        assert keys == {"PROJ-1", "PROJ-2"}
+        client._client.search_issues.assert_called_once()
+        call = client._client.search_issues.call_args
+        assert call.args[0] == (
+            'project in (PROJ) AND status IN (Done, Resolved, Closed) AND updated >= "2024-01-02 03:04"'
+        )
+        assert call.kwargs['fields'] == "key"
+    
+    def test_get_done_ticket_keys_follows_short_pages(self, client):
+        """Test that done keys past a capped first page are still found."""
+        keys = [f"PROJ-{i}" for i in range(120)]
+        
+        def search_issues(jql, startAt, maxResults, **kwargs):  # noqa: N803
+            page = ResultPage(SimpleNamespace(key=key) for key in keys[startAt:startAt + 50])
+            page.total = len(keys)
+            return page
+        
+        client._client.search_issues.side_effect = search_issues
+        
+        assert client.get_done_ticket_keys(datetime(2024, 1, 1)) == set(keys)
+    
+    def test_extract_ticket_data(self, client):
+        """Test extracting ticket data from an issue."""
+        ticket = client._extract_ticket_data(make_issue())
+        
+        assert ticket == {
+            'key': "PROJ-1",
+            'project': "PROJ",
+            'title': "Test ticket",
+            'description': '',
+            'assignee': "John Doe",
+            'assignee_email': "john@example.com",
+            'reporter': 'Unknown',
+            'reporter_email': None,
+            'priority': "High",
+            'status': "In Progress",
+            'created': "2024-01-01T10:00:00.000+0000",
+            'updated': "2024-01-02T15:30:00.000+0000",
+            'due_date': None,
+            'story_points': 5,
+            'sprint': None,
+            'comments': []
+        }
+    
+    def test_get_comments_uses_search_result(self, client):
+        """Test that embedded comments are used without another request."""
+        issue = SimpleNamespace(
+            key="PROJ-1",
+            fields=SimpleNamespace(comment=SimpleNamespace(
+                comments=[make_comment("Alice", "First")],
+                total=1
+            ))
+        )
+        
+        comments = client._get_comments(issue)
+        
+        assert comments == [{
+            'author': "Alice",
+            'created': "2024-01-01T10:00:00.000+0000",
+            'body': "First"
+        }]
+        client._client.comments.assert_not_called()
+    
+    def test_get_comments_falls_back_when_truncated(self, client):
+        """Test that truncated embedded comments are fetched in full."""
+        issue = SimpleNamespace(
+            key="PROJ-1",
+            fields=SimpleNamespace(comment=SimpleNamespace(
+                comments=[make_comment("Alice", "First")],
+                total=2
+            ))
+        )
+        client._client.comments.return_value = [
+            make_comment("Alice", "First"),
+            make_comment("Bob", "Second")
+        ]
+        
+        comments = client._get_comments(issue)
+        
+        assert [c['author'] for c in comments] == ["Alice", "Bob"]
+        client._client.comments.assert_called_once_with(issue)
+    
+    def test_iter_all_tickets_projects_fields(self, client):
+        """Test that searches request only the needed fields, 100 per page."""
+        client._client.search_issues.return_value = []
+        
+        assert list(client.iter_all_tickets()) == []
+        
+        _, kwargs = client._client.search_issues.call_args
+        assert kwargs['maxResults'] == 100
+        assert kwargs['fields'] == JiraClient.TICKET_FIELDS
+        assert kwargs['expand'] is None
+    
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_iter_all_tickets_pages_in_order(self, client, parallel):
+        """Test that every page is fetched and tickets keep their order."""
+        total = 250
+        
+        def search_issues(jql, startAt, maxResults, **kwargs):  # noqa: N803
+            page = ResultPage(range(startAt, min(startAt + maxResults, total)))
+            page.total = total
+            return page
+        
+        client._client.search_issues.side_effect = search_issues
+        client._extract_ticket_data = lambda issue: issue
+        
+        tickets = list(client.iter_all_tickets(parallel=parallel))
+        
+        assert tickets == list(range(total))
+        offsets = sorted(c.kwargs['startAt'] for c in client._client.search_issues.call_args_list)
+        assert offsets == [0, 100, 200]
+    
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_iter_all_tickets_follows_short_pages(self, client, parallel):
+        """Test that no tickets are lost when JIRA returns fewer than requested."""
+        total = 250
+        
+        def search_issues(jql, startAt, maxResults, **kwargs):  # noqa: N803
+            page = ResultPage(range(startAt, min(startAt + 50, total)))
+            page.total = total
+            return page
+        
+        client._client.search_issues.side_effect = search_issues
+        client._extract_ticket_data = lambda issue: issue
+        
+        tickets = list(client.iter_all_tickets(parallel=parallel))
+        
+        assert tickets == list(range(total))
+        offsets = sorted(c.kwargs['startAt'] for c in client._client.search_issues.call_args_list)
+        assert offsets == [0, 50, 100, 150, 200]
+    
+    def test_iter_all_tickets_tops_up_short_later_pages(self, client):
+        """Test that a later page shorter than the first is completed before moving on."""
+        total = 250
+        
+        def search_issues(jql, startAt, maxResults, **kwargs):  # noqa: N803
+            size = maxResults if startAt == 0 else 60
+            page = ResultPage(range(startAt, min(startAt + size, total)))
+            page.total = total
+            return page
+        
+        client._client.search_issues.side_effect = search_issues
+        client._extract_ticket_data = lambda issue: issue
+        
+        assert list(client.iter_all_tickets()) == list(range(total))
+    
+    def test_iter_all_tickets_parallel_respects_max_results(self, client):
+        """Test that pages beyond max_results are never requested."""
+        def search_issues(jql, startAt, maxResults, **kwargs):  # noqa: N803
+            page = ResultPage(range(startAt, startAt + maxResults))
+            page.total = 1000
+            return page
+        
+        client._client.search_issues.side_effect = search_issues
+        client._extract_ticket_data = lambda issue: issue
+        
+        tickets = client.get_all_tickets(max_results=150)
+        
+        assert tickets == list(range(150))
+        assert client._client.search_issues.call_count == 2
+    
+    def test_should_extract_skips_unchanged_issues(self, client):
+        """Test that rejected issues are never fully extracted."""
+        issues = [
+            SimpleNamespace(key="PROJ-1", fields=SimpleNamespace(updated="2024-01-02")),
+            SimpleNamespace(key="PROJ-2", fields=SimpleNamespace(updated="2024-01-01"))
+        ]
+        client._client.search_issues.return_value = issues
+        client._extract_ticket_data = Mock(side_effect=lambda issue: {'key': issue.key})
+        
+        tickets = client.get_updated_tickets(
+            since=datetime(2024, 1, 1),
+            should_extract=lambda key, updated: updated > "2024-01-01"
+        )
+        
+        assert tickets == [{'key': "PROJ-1"}]
+        client._extract_ticket_data.assert_called_once_with(issues[0])
+    
+    @pytest.mark.parametrize("sprint, expected", [
+        (SimpleNamespace(name="Sprint 1"), "Sprint 1"),
+        ("com.atlassian.greenhopper.service.sprint.Sprint@1[id=1,state=ACTIVE,name=Sprint 2,startDate=2024-01-01]", "Sprint 2"),
+        ("com.atlassian.greenhopper.service.sprint.Sprint@1[id=1,name=Sprint 3]", "Sprint 3"),
+        ("unrecognised", None),
+    ])
+    def test_extract_sprint_name(self, client, sprint, expected):
+        """Test sprint names from both object and string representations."""
+        ticket = client._extract_ticket_data(make_issue(customfield_10020=[sprint]))
+        
+        assert ticket['sprint'] == expected
+    
+    def test_iter_updated_tickets_is_lazy(self, client):
+        """Test that later pages are only fetched as tickets are consumed."""
+        page = ResultPage(range(100))
+        page.total = 300
+        client._client.search_issues.return_value = page
+        client._extract_ticket_data = lambda issue: issue
+        
+        tickets = client.iter_updated_tickets(since=datetime(2024, 1, 1))
+        client._client.search_issues.assert_not_called()
+        
+        assert next(tickets) == 0
+        assert client._client.search_issues.call_count == 1
+        tickets.close()
+    
+    def test_get_updated_tickets_filters_in_jql(self, client):
+        """Test that the update time filter is part of the search itself."""
+        client._client.search_issues.return_value = ResultPage()
+        
+        client.get_updated_tickets(since=datetime(2024, 1, 2, 3, 4))
+        
+        jql = client._client.search_issues.call_args.args[0]
+        assert jql == (
+            'project in (PROJ) AND updated >= "2024-01-02 03:04" '
+            'AND status NOT IN (Done, Resolved, Closed) ORDER BY updated DESC'
+        )
@@ -0,0 +1,38 @@
+"""Tests for JSON helpers."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from jira_to_obsidian import jsonutil
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request):
+    """Run a test against orjson (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield
+    else:
+        with patch.object(jsonutil, "orjson", None):
+            yield
+
+
+def test_round_trip(backend):
+    """Test that dumps output loads back to the same data."""
+    data = {"last_sync": None, "tickets": {"PROJ-1": {"updated": "2024-01-01"}}}
+    
+    assert jsonutil.loads(jsonutil.dumps(data)) == data
+
+
+def test_dumps_is_compact_bytes(backend):
+    """Test that dumps returns compact UTF-8 bytes."""
+    assert jsonutil.dumps({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode('utf-8')
+
+
+def test_dumps_stringifies_unknown_types(backend):
+    """Test that values without a JSON type are written as strings."""
+    when = datetime(2024, 1, 2, 3, 4, 5)
+    
+    assert isinstance(jsonutil.loads(jsonutil.dumps({"when": when}))["when"], str)
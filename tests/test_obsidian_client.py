@@ -1,48 +1,180 @@
 """Tests for Obsidian client module."""
 
-from unittest.mock import Mock, patch
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import unquote, urlsplit
 
 import pytest
 import requests
-import responses
 
-from jira_to_obsidian.config import ObsidianConfig
+from jira_to_obsidian.config import ConfigError, ObsidianConfig
+from jira_to_obsidian.httputil import build_adapter
 from jira_to_obsidian.obsidian_client import ObsidianClient
 
+# Only these tests need responses; skip them rather than fail collection without it
+responses = pytest.importorskip("responses")
+matchers = responses.matchers
+
+
+API_URL = "http://localhost:27123"
+VAULT_URL = f"{API_URL}/vault/"
+FOLDER_URL = f"{VAULT_URL}JIRA/"
+NOTE_URL = f"{FOLDER_URL}test.md"
+
+# Serialized once rather than by responses on every registration
+_EMPTY_FILES_BODY = json.dumps({"files": []}).encode()
+
+# Shared by every test in the module; tests that need a different
+# configuration must build their own copy with replace()
+_TEST_CONFIG = ObsidianConfig(
+    api_url=API_URL,
+    api_key="test-key",
+    folder="JIRA",
+    update_existing=True
+)
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Return the test configuration."""
+    return _TEST_CONFIG
+
+
+@pytest.fixture(scope="module")
+def _responses_mock():
+    """Patch requests once for the module rather than once per test."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def rsps(_responses_mock):
+    """The shared requests mock, cleared after each test."""
+    yield _responses_mock
+    _responses_mock.reset()
+
+
+class _VaultHandler(BaseHTTPRequestHandler):
+    """Minimal in-memory stand-in for the Obsidian REST API vault endpoints."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def setup(self):
+        """Count connections, so tests can check keep-alive reuse."""
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+    
+    def log_message(self, format, *args):
+        """Keep request logs out of the test output."""
+    
+    def _vault_path(self) -> str:
+        return unquote(urlsplit(self.path).path)[len("/vault/"):]
+    
+    def _reply(self, status: int, body: bytes = b"", content_type: str = "text/markdown"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+    
+    def do_GET(self):  # noqa: N802
+        path = self._vault_path()
+        with self.server.lock:
+            notes = dict(self.server.notes)
+        
+        if path == "" or path.endswith("/"):
+            names = sorted(
+                name[len(path):] for name in notes
+                if name.startswith(path) and "/" not in name[len(path):]
+            )
+            self._reply(200, json.dumps({"files": names}).encode(), "application/json")
+        elif path in notes:
+            self._reply(200, notes[path])
+        else:
+            self._reply(404)
+    
+    def do_HEAD(self):  # noqa: N802
+        self.do_GET()
+    
+    def do_PUT(self):  # noqa: N802
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.notes[self._vault_path()] = body
+        self._reply(204)
+    
+    def do_DELETE(self):  # noqa: N802
+        with self.server.lock:
+            found = self.server.notes.pop(self._vault_path(), None) is not None
+        self._reply(204 if found else 404)
+
+
+@pytest.fixture(scope="module")
+def vault_server():
+    """Run an in-memory vault on a loopback port for tests that need real sockets."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _VaultHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.notes = {}
+    server.connections = 0
+    
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def vault_client(rsps, vault_server):
+    """Create a client talking to the loopback vault, past the requests mock."""
+    url = f"http://127.0.0.1:{vault_server.server_port}"
+    rsps.add_passthru(url)
+    
+    with vault_server.lock:
+        vault_server.notes.clear()
+        vault_server.connections = 0
+    
+    with ObsidianClient(replace(_TEST_CONFIG, api_url=url, max_workers=5)) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def client(config):
+    """Create client instance."""
+    with ObsidianClient(config) as client:
+        yield client
+
 
 class TestObsidianClient:
     """Test ObsidianClient class."""
     
-    @pytest.fixture
-    def config(self):
-        """Create test configuration."""
-        return ObsidianConfig(
-            api_url="http://localhost:27123",
-            api_key="test-key",
-            folder="JIRA",
-            update_existing=True
-        )
-    
-    @pytest.fixture
-    def client(self, config):
-        """Create client instance."""
-        return ObsidianClient(config)
+    @pytest.fixture(autouse=True)
+    def reset_client(self, client):
+        """Drop the notes index a previous test may have built."""
+        client.invalidate_notes_index()
     
-    @responses.activate
-    def test_test_connection_success(self, client):
+    def test_test_connection_success(self, rsps, client):
         """Test successful connection test."""
         # Mock listing files in root
-        responses.add(
+        rsps.add(
             responses.GET,
-            "http://localhost:27123/vault/",
-            json={"files": []},
-            status=200
+            VAULT_URL,
+            body=_EMPTY_FILES_BODY,
+            status=200,
+            content_type="application/json"
         )
         
         # Mock folder check response
-        responses.add(
+        rsps.add(
             responses.GET,
-            "http://localhost:27123/vault/JIRA/",
+            FOLDER_URL,
             status=200
         )
         
@@ -53,12 +185,11 @@ class TestObsidianClient:
         assert result["folder_exists"] is True
         assert result["folder_path"] == "JIRA"
     
-    @responses.activate
-    def test_test_connection_unauthorized(self, client):
+    def test_test_connection_unauthorized(self, rsps, client):
         """Test connection with invalid API key."""
-        responses.add(
+        rsps.add(
             responses.GET,
-            "http://localhost:27123/vault/",
+            VAULT_URL,
             status=401
         )
         
@@ -68,139 +199,329 @@ class TestObsidianClient:
         assert result["authenticated"] is False
         assert result["error"] == "Invalid API key"
     
-    def test_test_connection_no_server(self, client):
+    def test_test_connection_no_server(self, rsps, client):
         """Test connection when server is not running."""
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.ConnectionError()
-            
-            result = client.test_connection()
-            
+        rsps.add(
+            responses.GET,
+            VAULT_URL,
+            body=requests.exceptions.ConnectionError("Connection refused")
+        )
+        
+        result = client.test_connection()
+        
         assert result["connected"] is False
         assert "Cannot connect to Obsidian REST API" in result["error"]
     
-    @responses.activate
-    def test_note_exists_true(self, client):
-        """Test checking if note exists (exists)."""
-        responses.add(
+    def test_test_connection_refused_fails_without_backoff(self, rsps, config):
+        """Test that a port with nothing listening is reported without retrying."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        rsps.add_passthru(url)
+        
+        with patch("urllib3.util.retry.time.sleep") as sleep:
+            with ObsidianClient(replace(config, api_url=url)) as client:
+                result = client.test_connection()
+        
+        assert result["connected"] is False
+        sleep.assert_not_called()
+    
+    @pytest.mark.parametrize("status, expected", [(200, True), (404, False)])
+    def test_note_exists(self, rsps, client, status, expected):
+        """Test checking if a note exists."""
+        rsps.add(
+            responses.HEAD,
+            NOTE_URL,
+            status=status
+        )
+        
+        assert client.note_exists("JIRA/test.md") is expected
+    
+    def test_note_exists_falls_back_to_get(self, rsps, client):
+        """Test checking if note exists on a server without HEAD support."""
+        rsps.add(
+            responses.HEAD,
+            NOTE_URL,
+            status=405
+        )
+        rsps.add(
             responses.GET,
-            "http://localhost:27123/vault/JIRA/test.md",
+            NOTE_URL,
             status=200
         )
         
         exists = client.note_exists("JIRA/test.md")
         assert exists is True
     
-    @responses.activate
-    def test_note_exists_false(self, client):
-        """Test checking if note exists (doesn't exist)."""
-        responses.add(
-            responses.GET,
-            "http://localhost:27123/vault/JIRA/test.md",
-            status=404
+    @pytest.mark.parametrize("status, expected", [
+        (201, True),   # created
+        (200, True),   # updated
+        (500, False),
+    ])
+    def test_save_note(self, rsps, client, status, expected):
+        """Test creating, updating and failing to save a note."""
+        rsps.add(
+            responses.PUT,
+            NOTE_URL,
+            status=status
         )
         
-        exists = client.note_exists("JIRA/test.md")
-        assert exists is False
+        assert client.save_note("JIRA/test.md", "# Test Content") is expected
     
-    @responses.activate
-    def test_save_note_create(self, client):
-        """Test creating a new note."""
-        responses.add(
+    def test_put_note_sends_if_match_and_returns_etag(self, rsps, client):
+        """Test that a stored ETag makes the write conditional and the new ETag is returned."""
+        rsps.add(
             responses.PUT,
-            "http://localhost:27123/vault/JIRA/test.md",
-            status=201
+            NOTE_URL,
+            status=204,
+            headers={"ETag": '"v2"'},
+            match=[matchers.header_matcher({"If-Match": '"v1"'})]
         )
         
-        success = client.save_note("JIRA/test.md", "# Test Content")
+        result = client.put_note("JIRA/test.md", "# Content", '"v1"')
+        
+        assert result.success is True
+        assert result.etag == '"v2"'
+        assert result.conflict is False
+    
+    def test_put_note_reports_conflict_without_overwriting(self, rsps, client):
+        """Test that a note edited in Obsidian since the last write is left alone."""
+        rsps.add(responses.PUT, NOTE_URL, status=412)
+        
+        result = client.put_note("JIRA/test.md", "# Content", '"stale"')
+        
+        assert result.success is False
+        assert result.conflict is True
+        assert len(rsps.calls) == 1
+    
+    @pytest.mark.parametrize("status, body, expected", [
+        (200, "# Test Note\nContent here", "# Test Note\nContent here"),
+        (404, "", None),
+    ])
+    def test_get_note_content(self, rsps, client, status, body, expected):
+        """Test getting note content, and None for a missing note."""
+        rsps.add(
+            responses.GET,
+            NOTE_URL,
+            body=body,
+            status=status,
+            content_type="text/markdown"
+        )
+        
+        assert client.get_note_content("JIRA/test.md") == expected
+    
+    def test_delete_note_success(self, rsps, client):
+        """Test successful note deletion."""
+        rsps.add(
+            responses.DELETE,
+            NOTE_URL,
+            status=204
+        )
+        
+        success = client.delete_note("JIRA/test.md")
         assert success is True
     
-    @responses.activate
-    def test_save_note_update(self, client):
-        """Test updating an existing note."""
-        responses.add(
+    def test_rename_note_with_content_skips_read(self, rsps, client):
+        """Test that renaming with new content takes one PUT and one DELETE."""
+        rsps.add(
             responses.PUT,
-            "http://localhost:27123/vault/JIRA/test.md",
+            FOLDER_URL + "PROJ-1%20New.md",
             status=200
         )
+        rsps.add(
+            responses.DELETE,
+            FOLDER_URL + "PROJ-1%20Old.md",
+            status=204
+        )
         
-        success = client.save_note("JIRA/test.md", "# Updated Content")
-        assert success is True
+        assert client.rename_note("JIRA/PROJ-1 Old.md", "JIRA/PROJ-1 New.md", "# New") is True
+        assert [call.request.method for call in rsps.calls] == ["PUT", "DELETE"]
+        assert rsps.calls[0].request.body == b"# New"
     
-    @responses.activate
-    def test_save_note_failure(self, client):
-        """Test failed note save."""
-        responses.add(
-            responses.PUT,
-            "http://localhost:27123/vault/JIRA/test.md",
-            status=500,
-            body="Internal Server Error"
+    def test_list_notes(self, rsps, client):
+        """Test listing markdown notes from both response formats."""
+        rsps.add(
+            responses.GET,
+            FOLDER_URL,
+            json={"files": [
+                "PROJ-2 Second.md", {"name": "PROJ-1 First.md"}, "image.png", {"name": None}, {}, 3
+            ]},
+            status=200
         )
         
-        success = client.save_note("JIRA/test.md", "# Content")
-        assert success is False
+        notes = client.list_notes()
+        assert notes == [
+            {'name': "PROJ-1 First.md", 'path': "JIRA/PROJ-1 First.md"},
+            {'name': "PROJ-2 Second.md", 'path': "JIRA/PROJ-2 Second.md"}
+        ]
     
-    @responses.activate
-    def test_get_note_content(self, client):
-        """Test getting note content."""
-        responses.add(
+    def test_list_notes_invalid_json(self, rsps, client):
+        """Test that an unparseable listing is treated as empty."""
+        rsps.add(
             responses.GET,
-            "http://localhost:27123/vault/JIRA/test.md",
-            body="# Test Note\nContent here",
-            status=200,
-            content_type="text/markdown"
+            FOLDER_URL,
+            body="not json",
+            status=200
         )
         
-        content = client.get_note_content("JIRA/test.md")
-        assert content == "# Test Note\nContent here"
+        assert client.list_notes() == []
     
-    @responses.activate
-    def test_get_note_content_not_found(self, client):
-        """Test getting content of non-existent note."""
-        responses.add(
+    def test_find_note_by_ticket_key_lists_folder_once(self, rsps, client):
+        """Test that lookups share one folder listing."""
+        rsps.add(
             responses.GET,
-            "http://localhost:27123/vault/JIRA/test.md",
-            status=404
+            FOLDER_URL,
+            json={"files": ["PROJ-1 First.md", "PROJ-2 Second.md", "README.md"]},
+            status=200
         )
         
-        content = client.get_note_content("JIRA/test.md")
-        assert content is None
+        assert client.find_note_by_ticket_key("PROJ-1") == "JIRA/PROJ-1 First.md"
+        assert client.find_note_by_ticket_key("PROJ-2") == "JIRA/PROJ-2 Second.md"
+        assert client.find_note_by_ticket_key("PROJ-3") is None
+        assert client.get_notes_index() == {
+            "PROJ-1": "JIRA/PROJ-1 First.md",
+            "PROJ-2": "JIRA/PROJ-2 Second.md"
+        }
+        assert len(rsps.calls) == 1
     
-    @responses.activate
-    def test_delete_note_success(self, client):
-        """Test successful note deletion."""
-        responses.add(
+    def test_notes_index_tracks_saves_and_deletes(self, rsps, client):
+        """Test that saving and deleting notes updates the cached index."""
+        rsps.add(
+            responses.GET,
+            FOLDER_URL,
+            json={"files": ["PROJ-1 Old.md"]},
+            status=200
+        )
+        rsps.add(
+            responses.PUT,
+            FOLDER_URL + "PROJ-1%20New.md",
+            status=200
+        )
+        rsps.add(
             responses.DELETE,
-            "http://localhost:27123/vault/JIRA/test.md",
+            FOLDER_URL + "PROJ-1%20Old.md",
             status=204
         )
         
-        success = client.delete_note("JIRA/test.md")
-        assert success is True
+        assert client.find_note_by_ticket_key("PROJ-1") == "JIRA/PROJ-1 Old.md"
+        
+        client.save_note("JIRA/PROJ-1 New.md", "# New")
+        client.delete_note("JIRA/PROJ-1 Old.md")
+        
+        assert client.find_note_by_ticket_key("PROJ-1") == "JIRA/PROJ-1 New.md"
+        assert len(rsps.calls) == 3
     
-    @responses.activate
-    def test_create_folder_if_needed(self, client):
+    def test_create_folder_if_needed(self, rsps, client):
         """Test creating folder when it doesn't exist."""
         # Mock folder check - doesn't exist
-        responses.add(
+        rsps.add(
             responses.GET,
-            "http://localhost:27123/vault/JIRA/",
+            FOLDER_URL,
             status=404
         )
         
         # Mock creating README file
-        responses.add(
+        rsps.add(
             responses.PUT,
-            "http://localhost:27123/vault/JIRA/README.md",
+            FOLDER_URL + "README.md",
             status=201
         )
         
         client.create_folder_if_needed()
         
         # Verify README was created
-        assert len(responses.calls) == 2
-        assert responses.calls[1].request.url.endswith("JIRA/README.md")
+        assert len(rsps.calls) == 2
+        assert rsps.calls[1].request.url.endswith("JIRA/README.md")
+    
+    def test_init_rejects_invalid_config(self, config):
+        """Test that an invalid configuration is rejected on construction."""
+        with pytest.raises(ConfigError) as exc_info:
+            ObsidianClient(replace(config, api_key=""))
+        
+        assert "OBSIDIAN_API_KEY is required" in exc_info.value.errors
     
     def test_headers_include_auth(self, client):
         """Test that headers include authorization."""
         assert client.headers["Authorization"] == "Bearer test-key"
-        assert client.headers["Content-Type"] == "application/json"
\ No newline at end of file
+        assert client.headers["Content-Type"] == "application/json"
+        assert isinstance(client.session, requests.Session)
+        assert client.session.headers["Authorization"] == "Bearer test-key"
+    
+    def test_session_uses_shared_pool(self, config):
+        """Test that both schemes share one keep-alive pool sized for the workers."""
+        with patch('jira_to_obsidian.obsidian_client.build_adapter', wraps=build_adapter) as build:
+            with ObsidianClient(config) as client:
+                adapter = client.session.get_adapter(VAULT_URL)
+                
+                assert adapter is client.session.get_adapter("https://localhost:27124/vault/")
+        
+        build.assert_called_once_with(config.max_workers)
+        assert adapter.max_retries.total > 0
+    
+    def test_transient_errors_are_retried(self, rsps, client):
+        """Test that a 503 is retried before the response reaches the caller."""
+        rsps.add(
+            responses.GET,
+            NOTE_URL,
+            status=503
+        )
+        rsps.add(
+            responses.GET,
+            NOTE_URL,
+            body="# Test",
+            status=200
+        )
+        
+        assert client.get_note_content("JIRA/test.md") == "# Test"
+        assert len(rsps.calls) == 2
+    
+    def test_save_note_sends_markdown_content_type(self, rsps, client):
+        """Test that saving a note overrides the session Content-Type."""
+        rsps.add(
+            responses.PUT,
+            NOTE_URL,
+            status=200
+        )
+        
+        client.save_note("JIRA/test.md", "# Content")
+        
+        request = rsps.calls[0].request
+        assert request.headers["Content-Type"] == "text/markdown"
+        assert request.headers["Authorization"] == "Bearer test-key"
+    
+    def test_context_manager_closes_session(self, config):
+        """Test that leaving the context manager closes the session."""
+        client = ObsidianClient(config)
+        
+        with patch.object(client.session, 'close') as mock_close:
+            with client:
+                pass
+        
+        mock_close.assert_called_once()
+
+
+class TestObsidianClientLoopback:
+    """Test ObsidianClient over real sockets against the loopback vault."""
+    
+    def test_parallel_saves_reuse_connections(self, vault_client, vault_server):
+        """Test that parallel saves land in the vault over a few kept-alive connections."""
+        items = [(f"JIRA/PROJ-{i} Note.md", f"# Note {i}") for i in range(50)]
+        
+        with ThreadPoolExecutor(max_workers=vault_client.config.max_workers) as executor:
+            results = list(executor.map(lambda item: vault_client.save_note(*item), items))
+        
+        assert results == [True] * 50
+        assert vault_server.notes["JIRA/PROJ-7 Note.md"] == b"# Note 7"
+        assert vault_server.connections <= vault_client.config.max_workers
+    
+    def test_note_round_trip(self, vault_client):
+        """Test saving, finding, renaming and deleting a note through the real stack."""
+        assert vault_client.save_note("JIRA/PROJ-1 Old.md", "# Old") is True
+        assert vault_client.note_exists("JIRA/PROJ-1 Old.md") is True
+        assert vault_client.find_note_by_ticket_key("PROJ-1") == "JIRA/PROJ-1 Old.md"
+        
+        assert vault_client.rename_note("JIRA/PROJ-1 Old.md", "JIRA/PROJ-1 New.md", "# New") is True
+        
+        assert vault_client.note_exists("JIRA/PROJ-1 Old.md") is False
+        assert vault_client.get_note_content("JIRA/PROJ-1 New.md") == "# New"
+        assert vault_client.list_notes() == [{"name": "PROJ-1 New.md", "path": "JIRA/PROJ-1 New.md"}]
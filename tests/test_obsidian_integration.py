@@ -0,0 +1,71 @@
+"""Record/replay tests for ObsidianClient against a real Obsidian REST API.
+
+The first run records cassettes from a running Obsidian instance (set
+OBSIDIAN_API_KEY and, if needed, OBSIDIAN_API_URL); later runs replay them
+without a server. Tests are skipped when vcrpy is missing or when there is
+neither a cassette nor an API key to record one.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from jira_to_obsidian.config import ObsidianConfig
+from jira_to_obsidian.obsidian_client import ObsidianClient
+
+vcr = pytest.importorskip("vcr")
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+# Keep recorded notes away from real synced tickets
+TEST_FOLDER = "JIRA-integration-test"
+
+_VCR = vcr.VCR(
+    cassette_library_dir=str(CASSETTE_DIR),
+    record_mode="once",
+    match_on=["method", "scheme", "host", "port", "path"],
+    filter_headers=["authorization"],
+)
+
+
+@pytest.fixture
+def client(request):
+    """Create a client that records to, or replays from, the test's cassette."""
+    cassette = f"{request.node.name}.yaml"
+    api_key = os.environ.get("OBSIDIAN_API_KEY", "")
+    if not api_key and not (CASSETTE_DIR / cassette).exists():
+        pytest.skip("no cassette recorded and OBSIDIAN_API_KEY not set")
+    
+    config = ObsidianConfig(
+        api_url=os.environ.get("OBSIDIAN_API_URL", "http://localhost:27123").rstrip("/"),
+        api_key=api_key or "replay",
+        folder=TEST_FOLDER,
+        update_existing=True
+    )
+    with _VCR.use_cassette(cassette), ObsidianClient(config) as client:
+        yield client
+
+
+def test_connection(client):
+    """Test that the API accepts the key and lists the vault."""
+    result = client.test_connection()
+    
+    assert result["connected"] is True
+    assert result["authenticated"] is True
+
+
+def test_note_round_trip(client):
+    """Test saving, reading, listing, renaming and deleting a note."""
+    old_path = f"{TEST_FOLDER}/PROJ-1 Old.md"
+    new_path = f"{TEST_FOLDER}/PROJ-1 New.md"
+    
+    assert client.save_note(old_path, "# Old") is True
+    assert client.get_note_content(old_path) == "# Old"
+    assert client.find_note_by_ticket_key("PROJ-1") == old_path
+    
+    assert client.rename_note(old_path, new_path, "# New") is True
+    assert client.note_exists(old_path) is False
+    assert client.get_note_content(new_path) == "# New"
+    
+    assert client.delete_note(new_path) is True
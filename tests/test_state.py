@@ -0,0 +1,83 @@
+"""Tests for state module."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from jira_to_obsidian.state import SyncState
+
+
+class TestSyncState:
+    """Test SyncState class."""
+    
+    @pytest.fixture
+    def state_file(self, tmp_path):
+        """Path for a temporary state file."""
+        return tmp_path / "sync_state.json"
+    
+    def test_save_and_reload(self, state_file):
+        """Test that saved ticket state survives a reload."""
+        state = SyncState(str(state_file))
+        state.update_ticket_state("PROJ-1", "2024-01-01T10:00:00+00:00", "JIRA/PROJ-1 Title.md")
+        state.save()
+        
+        reloaded = SyncState(str(state_file))
+        ticket_state = reloaded.get_ticket_state("PROJ-1")
+        
+        assert ticket_state["updated"] == "2024-01-01T10:00:00+00:00"
+        assert ticket_state["file_path"] == "JIRA/PROJ-1 Title.md"
+        assert "content_hash" not in ticket_state
+    
+    def test_content_hash_stored(self, state_file):
+        """Test that a note content hash is kept with the ticket state."""
+        state = SyncState(str(state_file))
+        state.update_ticket_state("PROJ-1", "2024-01-01T10:00:00+00:00", "JIRA/PROJ-1.md", "abc123")
+        state.save()
+        
+        assert SyncState(str(state_file)).get_ticket_state("PROJ-1")["content_hash"] == "abc123"
+    
+    def test_save_skipped_when_unchanged(self, state_file):
+        """Test that save does not write when nothing changed."""
+        state = SyncState(str(state_file))
+        state.save()
+        
+        assert not state_file.exists()
+    
+    def test_save_writes_compact_json_atomically(self, state_file):
+        """Test that save writes compact JSON and leaves no temp files."""
+        state = SyncState(str(state_file))
+        state.set_last_sync_time()
+        state.save()
+        
+        content = state_file.read_text()
+        assert json.loads(content)["last_sync"] is not None
+        assert "\n" not in content
+        assert list(state_file.parent.iterdir()) == [state_file]
+    
+    def test_save_fsyncs_before_replacing(self, state_file):
+        """Test that the new state is flushed to disk before it replaces the old file."""
+        state = SyncState(str(state_file))
+        state.set_last_sync_time()
+        
+        with patch('jira_to_obsidian.state.os.fsync') as fsync:
+            state.save()
+        
+        assert fsync.called
+        assert state_file.exists()
+    
+    def test_is_ticket_updated(self, state_file):
+        """Test comparing incoming JIRA timestamps with stored ones."""
+        state = SyncState(str(state_file))
+        
+        assert state.is_ticket_updated("PROJ-1", "2024-01-01T10:00:00.000+0000") is True
+        
+        state.update_ticket_state("PROJ-1", "2024-01-01T10:00:00.000+0000", "JIRA/PROJ-1.md")
+        
+        assert state.is_ticket_updated("PROJ-1", "2024-01-01T10:00:00.000+0000") is False
+        assert state.is_ticket_updated("PROJ-1", "2024-01-01T11:00:00.000+0100") is False
+        assert state.is_ticket_updated("PROJ-1", "2024-01-02T09:00:00.000+0000") is True
+        
+        state.update_ticket_state("PROJ-1", "2024-01-03T09:00:00.000+0000", "JIRA/PROJ-1.md")
+        
+        assert state.is_ticket_updated("PROJ-1", "2024-01-02T09:00:00.000+0000") is False
@@ -0,0 +1,287 @@
+"""Tests for sync module."""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from jira_to_obsidian.config import Config, JiraConfig, ObsidianConfig
+from jira_to_obsidian.obsidian_client import PutResult
+from jira_to_obsidian.state import SyncState
+from jira_to_obsidian.sync import DryRunAction, JiraObsidianSync
+
+
+def make_ticket(key: str, title: str = "Test ticket") -> dict:
+    """Create a ticket dictionary as returned by JiraClient."""
+    return {
+        'key': key,
+        'project': key.split('-')[0],
+        'title': title,
+        'description': '',
+        'assignee': 'Unassigned',
+        'assignee_email': None,
+        'reporter': 'Unknown',
+        'reporter_email': None,
+        'priority': 'High',
+        'status': 'In Progress',
+        'created': "2024-01-01T10:00:00.000+0000",
+        'updated': "2024-01-02T15:30:00.000+0000",
+        'due_date': None,
+        'story_points': None,
+        'sprint': None,
+        'comments': []
+    }
+
+
+class TestJiraObsidianSync:
+    """Test JiraObsidianSync class."""
+    
+    @pytest.fixture
+    def syncer(self, tmp_path):
+        """Create a sync instance with mocked clients and a temporary state file."""
+        config = Config(
+            jira=JiraConfig(
+                server="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token",
+                projects=["PROJ"]
+            ),
+            obsidian=ObsidianConfig(
+                api_url="http://localhost:27123",
+                api_key="test-key",
+                folder="JIRA",
+                update_existing=True,
+                max_workers=4
+            ),
+            sync_interval_minutes=15
+        )
+        with patch('jira_to_obsidian.sync.SyncState'):
+            syncer = JiraObsidianSync(config)
+        syncer.state = SyncState(str(tmp_path / "sync_state.json"))
+        syncer.jira_client = Mock()
+        syncer.obsidian_client = Mock()
+        syncer.obsidian_client.get_notes_index.return_value = {}
+        syncer.obsidian_client.put_note.return_value = PutResult(True)
+        return syncer
+    
+    def test_sync_processes_all_tickets(self, syncer):
+        """Test that every ticket is saved and counted."""
+        syncer.jira_client.iter_all_tickets.return_value = [
+            make_ticket(f"PROJ-{i}") for i in range(20)
+        ]
+        syncer.obsidian_client.put_note.side_effect = lambda path, content, etag: PutResult("PROJ-7 " not in path)
+        
+        results = syncer.sync(full_sync=True)
+        
+        assert results["tickets_found"] == 20
+        assert results["notes_created"] == 19
+        assert results["errors"] == ["Failed to save note: PROJ-7 Test ticket"]
+        assert len(syncer.state.get_all_tracked_tickets()) == 19
+    
+    def test_sync_uses_prefetched_notes_index(self, syncer):
+        """Test that existing notes come from one index instead of per-ticket lookups."""
+        syncer.jira_client.iter_all_tickets.return_value = [
+            make_ticket("PROJ-1", "Renamed"),
+            make_ticket("PROJ-2")
+        ]
+        syncer.obsidian_client.get_notes_index.return_value = {"PROJ-1": "JIRA/PROJ-1 Old.md"}
+        syncer.obsidian_client.rename_note.return_value = True
+        
+        results = syncer.sync(full_sync=True)
+        
+        assert results["notes_updated"] == 1
+        assert results["notes_created"] == 1
+        syncer.obsidian_client.get_notes_index.assert_called_once()
+        syncer.obsidian_client.find_note_by_ticket_key.assert_not_called()
+        syncer.obsidian_client.rename_note.assert_called_once()
+        assert syncer.obsidian_client.rename_note.call_args.args[:2] == (
+            "JIRA/PROJ-1 Old.md", "JIRA/PROJ-1 Renamed.md"
+        )
+    
+    def test_incremental_sync_untracks_done_tickets(self, syncer):
+        """Test that tracked tickets now in Done are dropped from state."""
+        last_sync = datetime(2024, 1, 1)
+        syncer.state.set_last_sync_time(last_sync)
+        for key in ("PROJ-1", "PROJ-2", "PROJ-3"):
+            syncer.state.update_ticket_state(key, "2024-01-01T10:00:00.000+0000", f"JIRA/{key}.md")
+        syncer.jira_client.iter_updated_tickets.return_value = [make_ticket("PROJ-1")]
+        syncer.jira_client.get_done_ticket_keys.return_value = {"PROJ-2", "OTHER-1"}
+        
+        results = syncer.sync()
+        
+        assert results["success"] is True
+        syncer.jira_client.get_done_ticket_keys.assert_called_once_with(last_sync)
+        assert set(syncer.state.get_all_tracked_tickets()) == {"PROJ-1", "PROJ-3"}
+        syncer.obsidian_client.delete_note.assert_not_called()
+    
+    @pytest.mark.parametrize("force, saved", [(False, 0), (True, 1)])
+    def test_sync_skips_unchanged_tickets(self, syncer, force, saved):
+        """Test that tickets with an unchanged updated time are not rewritten."""
+        ticket = make_ticket("PROJ-1")
+        syncer.state.update_ticket_state("PROJ-1", ticket['updated'], "JIRA/PROJ-1 Test ticket.md")
+        syncer.obsidian_client.get_notes_index.return_value = {"PROJ-1": "JIRA/PROJ-1 Test ticket.md"}
+        syncer.jira_client.iter_all_tickets.return_value = [ticket]
+        
+        results = syncer.sync(force=force)
+        
+        assert results["notes_skipped"] == 1 - saved
+        assert syncer.obsidian_client.put_note.call_count == saved
+    
+    def test_sync_recreates_missing_note_for_unchanged_ticket(self, syncer):
+        """Test that an unchanged ticket is written again if its note was removed."""
+        ticket = make_ticket("PROJ-1")
+        syncer.state.update_ticket_state("PROJ-1", ticket['updated'], "JIRA/PROJ-1 Test ticket.md")
+        syncer.jira_client.iter_all_tickets.return_value = [ticket]
+        
+        results = syncer.sync()
+        
+        assert results["notes_skipped"] == 0
+        assert results["notes_created"] == 1
+    
+    def test_full_dry_run_keeps_state(self, syncer):
+        """Test that a full dry run does not clear tracked tickets."""
+        syncer.state.update_ticket_state("PROJ-1", "2024-01-01T10:00:00.000+0000", "JIRA/PROJ-1.md")
+        syncer.jira_client.iter_all_tickets.return_value = []
+        
+        syncer.sync(dry_run=True, full_sync=True)
+        
+        assert syncer.state.get_ticket_state("PROJ-1") is not None
+    
+    def test_failed_incremental_sync_saves_progress(self, syncer):
+        """Test that notes written before a failure stay tracked, without moving last_sync."""
+        syncer.state.set_last_sync_time(datetime(2024, 1, 1))
+        syncer.state.save()
+        
+        def tickets():
+            yield make_ticket("PROJ-1")
+            raise RuntimeError("JIRA went away")
+        
+        syncer.jira_client.iter_updated_tickets.return_value = tickets()
+        
+        results = syncer.sync()
+        
+        reloaded = SyncState(str(syncer.state.state_file))
+        assert results["success"] is False
+        assert reloaded.get_ticket_state("PROJ-1") is not None
+        assert reloaded.get_last_sync_time() == datetime(2024, 1, 1)
+    
+    def test_failed_full_sync_keeps_previous_state(self, syncer):
+        """Test that a failed full sync doesn't persist the cleared state."""
+        syncer.state.update_ticket_state("PROJ-9", "2024-01-01T10:00:00.000+0000", "JIRA/PROJ-9.md")
+        syncer.state.save()
+        syncer.jira_client.iter_all_tickets.side_effect = RuntimeError("JIRA went away")
+        
+        results = syncer.sync(full_sync=True)
+        
+        assert results["success"] is False
+        assert SyncState(str(syncer.state.state_file)).get_ticket_state("PROJ-9") is not None
+    
+    def test_dry_run_keeps_ticket_order(self, syncer):
+        """Test that dry run actions are reported in fetch order."""
+        tickets = [make_ticket(f"PROJ-{i}") for i in range(20)]
+        syncer.jira_client.iter_all_tickets.return_value = tickets
+        
+        results = syncer.sync(dry_run=True, full_sync=True)
+        
+        assert [action.ticket for action in results["dry_run_actions"]] == [t['key'] for t in tickets]
+        assert results["notes_created"] == 20
+        syncer.obsidian_client.put_note.assert_not_called()
+    
+    def test_sync_streams_tickets_as_fetched(self, syncer):
+        """Test that tickets are consumed lazily and duplicates across pages are processed once."""
+        fetched = []
+        
+        def tickets():
+            for i in range(30):
+                fetched.append(i)
+                yield make_ticket(f"PROJ-{i}")
+            yield make_ticket("PROJ-0")
+        
+        syncer.jira_client.iter_all_tickets.return_value = tickets()
+        
+        results = syncer.sync(full_sync=True)
+        
+        assert len(fetched) == 30
+        assert results["tickets_found"] == 30
+        assert syncer.obsidian_client.put_note.call_count == 30
+    
+    def test_sync_single_ticket_renames_existing_note(self, syncer):
+        """Test that a single ticket sync finds its note by key and renames it."""
+        syncer.jira_client.get_ticket.return_value = make_ticket("PROJ-1", "New title")
+        syncer.obsidian_client.find_note_by_ticket_key.return_value = "JIRA/PROJ-1 Old title.md"
+        syncer.obsidian_client.rename_note.return_value = True
+        
+        results = syncer.sync_single_ticket("PROJ-1")
+        
+        assert results["success"] is True
+        assert results["note_updated"] is True
+        syncer.obsidian_client.put_note.assert_not_called()
+        assert syncer.obsidian_client.rename_note.call_args.args[:2] == (
+            "JIRA/PROJ-1 Old title.md", "JIRA/PROJ-1 New title.md"
+        )
+    
+    @pytest.mark.parametrize("change, saved", [({}, 1), ({'status': "Review"}, 2)])
+    def test_sync_skips_write_when_content_unchanged(self, syncer, change, saved):
+        """Test that an update that only moves the updated time doesn't rewrite the note."""
+        ticket = make_ticket("PROJ-1")
+        syncer.obsidian_client.get_notes_index.return_value = {"PROJ-1": "JIRA/PROJ-1 Test ticket.md"}
+        syncer.jira_client.iter_all_tickets.return_value = [ticket]
+        syncer.sync(force=True)
+        
+        newer = dict(ticket, updated="2024-01-03T09:00:00.000+0000", **change)
+        syncer.jira_client.iter_updated_tickets.return_value = [newer]
+        
+        results = syncer.sync()
+        
+        assert results["notes_skipped"] == 2 - saved
+        assert syncer.obsidian_client.put_note.call_count == saved
+        assert syncer.state.get_ticket_state("PROJ-1")["updated"] == newer['updated']
+    
+    def test_sync_sends_stored_etag(self, syncer):
+        """Test that the ETag of the last write guards the next one and is replaced."""
+        ticket = make_ticket("PROJ-1")
+        syncer.state.update_ticket_state("PROJ-1", "2024-01-01T10:00:00.000+0000", "JIRA/PROJ-1 Test ticket.md", "old", '"v1"')
+        syncer.obsidian_client.get_notes_index.return_value = {"PROJ-1": "JIRA/PROJ-1 Test ticket.md"}
+        syncer.obsidian_client.put_note.return_value = PutResult(True, '"v2"')
+        syncer.jira_client.iter_all_tickets.return_value = [ticket]
+        
+        syncer.sync()
+        
+        assert syncer.obsidian_client.put_note.call_args.args[2] == '"v1"'
+        assert syncer.state.get_ticket_state("PROJ-1")["etag"] == '"v2"'
+    
+    def test_sync_reports_note_edited_in_obsidian(self, syncer):
+        """Test that an ETag conflict is reported apart from errors and the stored ETag is kept."""
+        syncer.state.update_ticket_state("PROJ-1", "2024-01-01T10:00:00.000+0000", "JIRA/PROJ-1 Test ticket.md", "old", '"v1"')
+        syncer.obsidian_client.get_notes_index.return_value = {"PROJ-1": "JIRA/PROJ-1 Test ticket.md"}
+        syncer.obsidian_client.put_note.return_value = PutResult(False, conflict=True)
+        syncer.jira_client.iter_all_tickets.return_value = [make_ticket("PROJ-1")]
+    
+        results = syncer.sync()
+    
+        assert results["success"] is True
+        assert results["errors"] == []
+        assert results["conflicts"] == ["PROJ-1: JIRA/PROJ-1 Test ticket.md was edited in Obsidian since the last sync"]
+        assert syncer.state.get_last_sync_time() is not None
+        assert syncer.obsidian_client.put_note.call_count == 1
+        assert syncer.state.get_ticket_state("PROJ-1")["etag"] == '"v1"'
+
+
+@pytest.mark.parametrize("content, preview", [
+    ("short", "short"),
+    ("x" * 600, "x" * 500 + "..."),
+])
+def test_dry_run_action_preview(content, preview):
+    """Test that the dry run preview is cut from the full content on demand."""
+    action = DryRunAction(
+        action="CREATE",
+        ticket="PROJ-1",
+        file_path="JIRA/PROJ-1.md",
+        old_file_path=None,
+        api_endpoint="http://localhost/vault/JIRA/PROJ-1.md",
+        content=content
+    )
+
+    assert action.content_preview == preview
+    assert action.content_length == len(content)
+    assert action.headers["Authorization"] == "Bearer [REDACTED]"